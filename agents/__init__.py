@@ -8,20 +8,8 @@ Specialized agents for different domains, coordinated by an orchestrator.
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from agents.definitions import (
-    AGENT_DEFINITIONS,
-    CHATGPT_AGENT,
-    CODING_AGENT,
-    GEMINI_AGENT,
-    GITHUB_AGENT,
-    GROQ_AGENT,
-    KIMI_AGENT,
-    LINEAR_AGENT,
-    PR_REVIEWER_AGENT,
-    QA_AGENT,
-    SLACK_AGENT,
-    WINDSURF_AGENT,
-)
+from agents import definitions as _definitions
+from agents.definitions import AGENT_DEFINITIONS
 
 if TYPE_CHECKING:
     from claude_agent_sdk import ClaudeSDKClient
@@ -45,6 +33,17 @@ __all__ = [
 ]
 
 
+def __getattr__(name: str) -> object:
+    """Forward agent constants (LINEAR_AGENT, ...) to agents.definitions lazily.
+
+    Importing them eagerly here would build every agent definition, and
+    read every prompt file, as soon as the package is imported.
+    """
+    if name in __all__:
+        return getattr(_definitions, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 async def run_orchestrated_session(
     client: "ClaudeSDKClient",
     project_dir: Path,
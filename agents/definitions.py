@@ -3,10 +3,13 @@ Agent Definitions - All orchestrator sub-agents including PR Reviewer,
 ChatGPT, Gemini, Groq, KIMI, and Windsurf for multi-AI orchestration.
 """
 
+import dataclasses
+import functools
 import os
 import sys
+from collections.abc import Callable, Iterator, Mapping
 from pathlib import Path
-from typing import Final, Literal, NamedTuple
+from typing import TYPE_CHECKING, Final, Literal, NamedTuple
 
 # TypeGuard is only available in Python 3.10+
 if sys.version_info >= (3, 10):
@@ -18,13 +21,6 @@ else:
         # Fallback for Python 3.9 without typing_extensions
         TypeGuard = type  # type: ignore
 
-from arcade_config import (
-    get_coding_tools,
-    get_github_tools,
-    get_linear_tools,
-    get_qa_tools,
-    get_slack_tools,
-)
 from claude_agent_sdk.types import AgentDefinition
 from agents.model_routing import (
     CostTracker,
@@ -37,8 +33,10 @@ from agents.model_routing import (
 
 FILE_TOOLS: list[str] = ["Read", "Write", "Edit", "Glob"]
 PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
+# Plain-string form of PROMPTS_DIR for the os-level prompt loading below.
+_PROMPTS_DIR_STR: Final[str] = os.fspath(PROMPTS_DIR)
 ModelOption = Literal["haiku", "sonnet", "opus", "inherit"]
-_VALID_MODELS: Final[tuple[str, ...]] = ("haiku", "sonnet", "opus", "inherit")
+_VALID_MODELS: Final[frozenset[str]] = frozenset(("haiku", "sonnet", "opus", "inherit"))
 
 DEFAULT_MODELS: Final[dict[str, ModelOption]] = {
     "linear": "haiku",
@@ -69,9 +67,14 @@ def _is_valid_model(value: str) -> TypeGuard[ModelOption]:
     return value in _VALID_MODELS
 
 
+# Model overrides are read from the environment once per process; tests that
+# change *_AGENT_MODEL / ORCHESTRATOR_MODEL should call _reset_caches().
+# Env values are interned so they share storage with the model literals,
+# which the compiler already interns.
+@functools.cache
 def _get_model(agent_name: str) -> ModelOption:
     env_var = f"{agent_name.upper()}_AGENT_MODEL"
-    value = os.environ.get(env_var, "").lower().strip()
+    value = sys.intern(os.environ.get(env_var, "").lower().strip())
     if _is_valid_model(value):
         return value
     default = DEFAULT_MODELS.get(agent_name)
@@ -80,20 +83,46 @@ def _get_model(agent_name: str) -> ModelOption:
     return "haiku"
 
 
+_prompt_paths: dict[str, str] | None = None
+
+
+def _get_prompt_paths() -> dict[str, str]:
+    """Index the *.md files in PROMPTS_DIR by name (scanned once per process)."""
+    global _prompt_paths
+    if _prompt_paths is None:
+        with os.scandir(_PROMPTS_DIR_STR) as entries:
+            _prompt_paths = {
+                entry.name[:-3]: entry.path
+                for entry in entries
+                if entry.name.endswith(".md") and entry.is_file()
+            }
+    return _prompt_paths
+
+
+@functools.cache
 def _load_prompt(name: str) -> str:
-    return (PROMPTS_DIR / f"{name}.md").read_text()
+    # Fall back to the plain path so a missing prompt still raises
+    # FileNotFoundError from os.open().
+    path = _get_prompt_paths().get(name) or os.path.join(_PROMPTS_DIR_STR, name + ".md")
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+    return data.decode("utf-8")
 
 
 OrchestratorModelOption = Literal["haiku", "sonnet", "opus"]
-_VALID_ORCHESTRATOR_MODELS: Final[tuple[str, ...]] = ("haiku", "sonnet", "opus")
+_VALID_ORCHESTRATOR_MODELS: Final[frozenset[str]] = frozenset(("haiku", "sonnet", "opus"))
 
 
 def _is_valid_orchestrator_model(value: str) -> TypeGuard[OrchestratorModelOption]:
     return value in _VALID_ORCHESTRATOR_MODELS
 
 
+@functools.cache
 def get_orchestrator_model() -> OrchestratorModelOption:
-    value = os.environ.get("ORCHESTRATOR_MODEL", "").lower().strip()
+    value = sys.intern(os.environ.get("ORCHESTRATOR_MODEL", "").lower().strip())
     if _is_valid_orchestrator_model(value):
         return value
     return "sonnet"
@@ -159,260 +188,355 @@ Commits without `--author` will be BLOCKED by the security system.
 """
 
 
-def _get_bridge_agent_tools() -> list[str]:
+# Tool groups are assembled once and shared by every agent that uses them;
+# each AgentDefinition gets its own list copy so callers can't mutate a group.
+# arcade_config is imported inside each helper so it is only loaded once an
+# agent definition is actually built.
+
+
+@functools.cache
+def _get_linear_agent_tools() -> tuple[str, ...]:
+    """Tools for Linear agent — Linear MCP + file ops."""
+    from arcade_config import get_linear_tools
+
+    return (*get_linear_tools(), *FILE_TOOLS)
+
+
+@functools.cache
+def _get_slack_agent_tools() -> tuple[str, ...]:
+    """Tools for Slack agent — Slack MCP + file ops."""
+    from arcade_config import get_slack_tools
+
+    return (*get_slack_tools(), *FILE_TOOLS)
+
+
+@functools.cache
+def _get_coding_agent_tools() -> tuple[str, ...]:
+    """Tools for coding agents — file ops + bash + Playwright."""
+    from arcade_config import get_coding_tools
+
+    return tuple(get_coding_tools())
+
+
+@functools.cache
+def _get_bridge_agent_tools() -> tuple[str, ...]:
     """Tools for bridge agents (ChatGPT, Gemini, Groq, KIMI, Windsurf) — file ops + bash."""
-    return FILE_TOOLS + ["Bash"]
+    return (*FILE_TOOLS, "Bash")
 
 
-def _get_pr_reviewer_tools() -> list[str]:
+@functools.cache
+def _get_pr_reviewer_tools() -> tuple[str, ...]:
     """Tools for PR reviewer — GitHub MCP + file ops + bash."""
-    return get_github_tools() + FILE_TOOLS + ["Bash"]
+    from arcade_config import get_github_tools
 
+    return (*get_github_tools(), *FILE_TOOLS, "Bash")
 
-def _get_ops_agent_tools() -> list[str]:
+
+@functools.cache
+def _get_ops_agent_tools() -> tuple[str, ...]:
     """Tools for ops agent — Linear + Slack + GitHub + file ops."""
-    return get_linear_tools() + get_slack_tools() + get_github_tools() + FILE_TOOLS
+    from arcade_config import get_github_tools, get_linear_tools, get_slack_tools
+
+    return (*get_linear_tools(), *get_slack_tools(), *get_github_tools(), *FILE_TOOLS)
 
 
-def _get_pm_agent_tools() -> list[str]:
+@functools.cache
+def _get_pm_agent_tools() -> tuple[str, ...]:
     """Tools for product manager — Slack + Linear + GitHub + file ops + bash."""
+    from arcade_config import get_github_tools, get_linear_tools, get_slack_tools
+
     return (
-        get_slack_tools() + get_linear_tools() + get_github_tools()
-        + FILE_TOOLS + ["Bash", "Grep"]
+        *get_slack_tools(), *get_linear_tools(), *get_github_tools(),
+        *FILE_TOOLS, "Bash", "Grep",
     )
 
 
-def _get_designer_agent_tools() -> list[str]:
+@functools.cache
+def _get_designer_agent_tools() -> tuple[str, ...]:
     """Tools for designer agent — file ops + bash + Slack for collaboration."""
-    return get_slack_tools() + FILE_TOOLS + ["Bash", "Grep"]
+    from arcade_config import get_slack_tools
 
+    return (*get_slack_tools(), *FILE_TOOLS, "Bash", "Grep")
 
-def _get_jira_agent_tools() -> list[str]:
+
+@functools.cache
+def _get_jira_agent_tools() -> tuple[str, ...]:
     """Tools for Jira integration agent — Jira MCP + file ops + bash."""
     # Import here to avoid circular imports at module load time
     try:
         from arcade_config import get_jira_tools  # type: ignore[import]
-        return get_jira_tools() + FILE_TOOLS + ["Bash"]
+        return (*get_jira_tools(), *FILE_TOOLS, "Bash")
     except (ImportError, AttributeError):
         # Jira MCP tools not yet configured — fall back to file ops only
-        return FILE_TOOLS + ["Bash"]
+        return _get_bridge_agent_tools()
 
 
-def _get_gitlab_agent_tools() -> list[str]:
+def _get_gitlab_agent_tools() -> tuple[str, ...]:
     """Tools for GitLab integration agent — GitHub MCP (for git ops) + file ops + bash."""
-    return get_github_tools() + FILE_TOOLS + ["Bash"]
+    return _get_pr_reviewer_tools()
 
 
-def create_agent_definitions() -> dict[str, AgentDefinition]:
-    def _prompt(name: str, prompt_file: str) -> str:
-        return _load_prompt(prompt_file) + _build_git_identity_prompt(name)
+@functools.cache
+def _get_knowledge_base_tools() -> tuple[str, ...]:
+    """Tools for knowledge base agent — file ops + bash + grep."""
+    return (*FILE_TOOLS, "Bash", "Grep")
 
-    return {
-        "linear": AgentDefinition(
-            description="Manages Linear issues, project status, and session handoff.",
-            prompt=_prompt("linear", "linear_agent_prompt"),
-            tools=get_linear_tools() + FILE_TOOLS,
-            model=_get_model("linear"),
-        ),
-        "github": AgentDefinition(
-            description="Handles Git commits, branches, and GitHub PRs.",
-            prompt=_prompt("github", "github_agent_prompt"),
-            tools=get_github_tools() + FILE_TOOLS + ["Bash"],
-            model=_get_model("github"),
-        ),
-        "slack": AgentDefinition(
-            description="Sends Slack notifications to keep users informed.",
-            prompt=_prompt("slack", "slack_agent_prompt"),
-            tools=get_slack_tools() + FILE_TOOLS,
-            model=_get_model("slack"),
-        ),
-        "coding": AgentDefinition(
-            description="Writes and tests code.",
-            prompt=_prompt("coding", "coding_agent_prompt"),
-            tools=get_coding_tools(),
-            model=_get_model("coding"),
-        ),
-        "pr_reviewer": AgentDefinition(
-            description=(
-                "Automated PR reviewer. Reviews PRs for quality, correctness, "
-                "and test coverage. Approves and merges or requests changes."
-            ),
-            prompt=_prompt("pr_reviewer", "pr_reviewer_agent_prompt"),
-            tools=_get_pr_reviewer_tools(),
-            model=_get_model("pr_reviewer"),
+
+@functools.cache
+def _get_qa_agent_tools() -> tuple[str, ...]:
+    """Tools for QA agent — file ops + Playwright + test runners."""
+    from arcade_config import get_qa_tools
+
+    return tuple(get_qa_tools())
+
+
+def _prompt(name: str, prompt_file: str) -> str:
+    return _load_prompt(prompt_file) + _build_git_identity_prompt(name)
+
+
+class _AgentSpec(NamedTuple):
+    """Static configuration for one sub-agent."""
+
+    description: str
+    prompt_file: str
+    tools: Callable[[], tuple[str, ...]]
+
+
+_AGENT_SPECS: Final[dict[str, _AgentSpec]] = {
+    "linear": _AgentSpec(
+        description="Manages Linear issues, project status, and session handoff.",
+        prompt_file="linear_agent_prompt",
+        tools=_get_linear_agent_tools,
+    ),
+    "github": _AgentSpec(
+        description="Handles Git commits, branches, and GitHub PRs.",
+        prompt_file="github_agent_prompt",
+        tools=_get_pr_reviewer_tools,
+    ),
+    "slack": _AgentSpec(
+        description="Sends Slack notifications to keep users informed.",
+        prompt_file="slack_agent_prompt",
+        tools=_get_slack_agent_tools,
+    ),
+    "coding": _AgentSpec(
+        description="Writes and tests code.",
+        prompt_file="coding_agent_prompt",
+        tools=_get_coding_agent_tools,
+    ),
+    "pr_reviewer": _AgentSpec(
+        description=(
+            "Automated PR reviewer. Reviews PRs for quality, correctness, "
+            "and test coverage. Approves and merges or requests changes."
         ),
-        "ops": AgentDefinition(
-            description=(
-                "Composite operations agent. Handles all lightweight non-coding "
-                "operations (Linear transitions, Slack notifications, GitHub labels) "
-                "in a single delegation. Replaces sequential linear+slack+github calls."
-            ),
-            prompt=_prompt("ops", "ops_agent_prompt"),
-            tools=_get_ops_agent_tools(),
-            model=_get_model("ops"),
+        prompt_file="pr_reviewer_agent_prompt",
+        tools=_get_pr_reviewer_tools,
+    ),
+    "ops": _AgentSpec(
+        description=(
+            "Composite operations agent. Handles all lightweight non-coding "
+            "operations (Linear transitions, Slack notifications, GitHub labels) "
+            "in a single delegation. Replaces sequential linear+slack+github calls."
         ),
-        "coding_fast": AgentDefinition(
-            description=(
-                "Fast coding agent using haiku. Use for simple changes: "
-                "copy updates, CSS fixes, config changes, adding tests, "
-                "renaming, documentation. Faster than the default coding agent."
-            ),
-            prompt=_prompt("coding_fast", "coding_agent_prompt"),
-            tools=get_coding_tools(),
-            model=_get_model("coding_fast"),
+        prompt_file="ops_agent_prompt",
+        tools=_get_ops_agent_tools,
+    ),
+    "coding_fast": _AgentSpec(
+        description=(
+            "Fast coding agent using haiku. Use for simple changes: "
+            "copy updates, CSS fixes, config changes, adding tests, "
+            "renaming, documentation. Faster than the default coding agent."
         ),
-        "pr_reviewer_fast": AgentDefinition(
-            description=(
-                "Fast PR reviewer using haiku. Use for low-risk reviews: "
-                "frontend-only changes, <= 3 files changed, no auth/db/API changes. "
-                "Faster than the default PR reviewer."
-            ),
-            prompt=_prompt("pr_reviewer_fast", "pr_reviewer_agent_prompt"),
-            tools=_get_pr_reviewer_tools(),
-            model=_get_model("pr_reviewer_fast"),
+        prompt_file="coding_agent_prompt",
+        tools=_get_coding_agent_tools,
+    ),
+    "pr_reviewer_fast": _AgentSpec(
+        description=(
+            "Fast PR reviewer using haiku. Use for low-risk reviews: "
+            "frontend-only changes, <= 3 files changed, no auth/db/API changes. "
+            "Faster than the default PR reviewer."
         ),
-        "chatgpt": AgentDefinition(
-            description=(
-                "Provides access to OpenAI ChatGPT models (GPT-4o, o1, o3-mini, o4-mini). "
-                "Use for cross-validation, ChatGPT-specific tasks, second opinions on code, "
-                "or when the user explicitly requests ChatGPT."
-            ),
-            prompt=_prompt("chatgpt", "chatgpt_agent_prompt"),
-            tools=_get_bridge_agent_tools(),
-            model=_get_model("chatgpt"),
+        prompt_file="pr_reviewer_agent_prompt",
+        tools=_get_pr_reviewer_tools,
+    ),
+    "chatgpt": _AgentSpec(
+        description=(
+            "Provides access to OpenAI ChatGPT models (GPT-4o, o1, o3-mini, o4-mini). "
+            "Use for cross-validation, ChatGPT-specific tasks, second opinions on code, "
+            "or when the user explicitly requests ChatGPT."
         ),
-        "gemini": AgentDefinition(
-            description=(
-                "Provides access to Google Gemini models (2.5 Flash, 2.5 Pro, 2.0 Flash). "
-                "Use for cross-validation, research, Google ecosystem tasks, "
-                "or large-context analysis (1M token window)."
-            ),
-            prompt=_prompt("gemini", "gemini_agent_prompt"),
-            tools=_get_bridge_agent_tools(),
-            model=_get_model("gemini"),
+        prompt_file="chatgpt_agent_prompt",
+        tools=_get_bridge_agent_tools,
+    ),
+    "gemini": _AgentSpec(
+        description=(
+            "Provides access to Google Gemini models (2.5 Flash, 2.5 Pro, 2.0 Flash). "
+            "Use for cross-validation, research, Google ecosystem tasks, "
+            "or large-context analysis (1M token window)."
         ),
-        "groq": AgentDefinition(
-            description=(
-                "Provides ultra-fast inference on open-source models (Llama 3.3 70B, "
-                "Mixtral 8x7B, Gemma 2 9B) via Groq LPU hardware. Use for rapid "
-                "cross-validation, bulk code review, or speed-critical tasks."
-            ),
-            prompt=_prompt("groq", "groq_agent_prompt"),
-            tools=_get_bridge_agent_tools(),
-            model=_get_model("groq"),
+        prompt_file="gemini_agent_prompt",
+        tools=_get_bridge_agent_tools,
+    ),
+    "groq": _AgentSpec(
+        description=(
+            "Provides ultra-fast inference on open-source models (Llama 3.3 70B, "
+            "Mixtral 8x7B, Gemma 2 9B) via Groq LPU hardware. Use for rapid "
+            "cross-validation, bulk code review, or speed-critical tasks."
         ),
-        "kimi": AgentDefinition(
-            description=(
-                "Provides access to Moonshot AI KIMI models with ultra-long context "
-                "(up to 2M tokens). Use for analyzing entire codebases in one pass, "
-                "bilingual Chinese/English tasks, or large-scale code analysis."
-            ),
-            prompt=_prompt("kimi", "kimi_agent_prompt"),
-            tools=_get_bridge_agent_tools(),
-            model=_get_model("kimi"),
+        prompt_file="groq_agent_prompt",
+        tools=_get_bridge_agent_tools,
+    ),
+    "kimi": _AgentSpec(
+        description=(
+            "Provides access to Moonshot AI KIMI models with ultra-long context "
+            "(up to 2M tokens). Use for analyzing entire codebases in one pass, "
+            "bilingual Chinese/English tasks, or large-scale code analysis."
         ),
-        "windsurf": AgentDefinition(
-            description=(
-                "Runs Codeium Windsurf IDE in headless mode for parallel coding tasks. "
-                "Use for cross-IDE validation, alternative implementations, or when "
-                "Windsurf's Cascade model adds unique value to a coding task."
-            ),
-            prompt=_prompt("windsurf", "windsurf_agent_prompt"),
-            tools=_get_bridge_agent_tools(),
-            model=_get_model("windsurf"),
+        prompt_file="kimi_agent_prompt",
+        tools=_get_bridge_agent_tools,
+    ),
+    "windsurf": _AgentSpec(
+        description=(
+            "Runs Codeium Windsurf IDE in headless mode for parallel coding tasks. "
+            "Use for cross-IDE validation, alternative implementations, or when "
+            "Windsurf's Cascade model adds unique value to a coding task."
         ),
-        "openrouter_dev": AgentDefinition(
-            description=(
-                "Provides access to 200+ models via OpenRouter (DeepSeek, Llama, Gemma, "
-                "Mistral). Use for multi-provider fallback, free-tier parallel coding, "
-                "or cost-optimized bulk tasks."
-            ),
-            prompt=_prompt("openrouter_dev", "openrouter_dev_agent_prompt"),
-            tools=_get_bridge_agent_tools(),
-            model=_get_model("openrouter_dev"),
+        prompt_file="windsurf_agent_prompt",
+        tools=_get_bridge_agent_tools,
+    ),
+    "openrouter_dev": _AgentSpec(
+        description=(
+            "Provides access to 200+ models via OpenRouter (DeepSeek, Llama, Gemma, "
+            "Mistral). Use for multi-provider fallback, free-tier parallel coding, "
+            "or cost-optimized bulk tasks."
         ),
-        "product_manager": AgentDefinition(
-            description=(
-                "Manages product strategy, backlog grooming, sprint planning, and "
-                "cross-agent coordination. Creates and assigns issues including "
-                "[DESIGN]-prefixed tasks for the Designer agent."
-            ),
-            prompt=_prompt("product_manager", "product_manager_agent_prompt"),
-            tools=_get_pm_agent_tools(),
-            model=_get_model("product_manager"),
+        prompt_file="openrouter_dev_agent_prompt",
+        tools=_get_bridge_agent_tools,
+    ),
+    "product_manager": _AgentSpec(
+        description=(
+            "Manages product strategy, backlog grooming, sprint planning, and "
+            "cross-agent coordination. Creates and assigns issues including "
+            "[DESIGN]-prefixed tasks for the Designer agent."
         ),
-        "designer": AgentDefinition(
-            description=(
-                "UI/UX design specialist. Creates design systems, component specs, "
-                "CSS implementations, and accessibility audits. Works on [DESIGN]-prefixed "
-                "issues assigned by the Product Manager."
-            ),
-            prompt=_prompt("designer", "designer_agent_prompt"),
-            tools=_get_designer_agent_tools(),
-            model=_get_model("designer"),
+        prompt_file="product_manager_agent_prompt",
+        tools=_get_pm_agent_tools,
+    ),
+    "designer": _AgentSpec(
+        description=(
+            "UI/UX design specialist. Creates design systems, component specs, "
+            "CSS implementations, and accessibility audits. Works on [DESIGN]-prefixed "
+            "issues assigned by the Product Manager."
         ),
-        "jira": AgentDefinition(
-            description=(
-                "Jira integration agent for bidirectional issue sync. "
-                "Handles inbound Jira webhooks, maps Jira issues to Agent-Engineers "
-                "format, and posts completion updates (PR links, test summaries) "
-                "back to Jira. Enables enterprise Jira customers to use "
-                "Agent-Engineers without migrating to Linear."
-            ),
-            prompt=_prompt("jira", "jira_agent_prompt"),
-            tools=_get_jira_agent_tools(),
-            model=_get_model("jira"),
+        prompt_file="designer_agent_prompt",
+        tools=_get_designer_agent_tools,
+    ),
+    "jira": _AgentSpec(
+        description=(
+            "Jira integration agent for bidirectional issue sync. "
+            "Handles inbound Jira webhooks, maps Jira issues to Agent-Engineers "
+            "format, and posts completion updates (PR links, test summaries) "
+            "back to Jira. Enables enterprise Jira customers to use "
+            "Agent-Engineers without migrating to Linear."
         ),
-        "gitlab": AgentDefinition(
-            description=(
-                "GitLab integration agent for branch, MR, and CI/CD pipeline management. "
-                "Creates feature branches, commits via GitLab API, opens Merge Requests "
-                "with description and labels, assigns reviewers, gates merges on pipeline "
-                "status, and surfaces CI/CD results in the Agent Dashboard. Enables "
-                "enterprise GitLab customers to use Agent-Engineers without migrating "
-                "to GitHub."
-            ),
-            prompt=_prompt("gitlab", "gitlab_agent_prompt"),
-            tools=_get_gitlab_agent_tools(),
-            model=_get_model("gitlab"),
+        prompt_file="jira_agent_prompt",
+        tools=_get_jira_agent_tools,
+    ),
+    "gitlab": _AgentSpec(
+        description=(
+            "GitLab integration agent for branch, MR, and CI/CD pipeline management. "
+            "Creates feature branches, commits via GitLab API, opens Merge Requests "
+            "with description and labels, assigns reviewers, gates merges on pipeline "
+            "status, and surfaces CI/CD results in the Agent Dashboard. Enables "
+            "enterprise GitLab customers to use Agent-Engineers without migrating "
+            "to GitHub."
         ),
-        "knowledge_base": AgentDefinition(
-            description=(
-                "Knowledge Base Agent for RAG-based project context retrieval. "
-                "Indexes codebase documentation, PR history, and architecture docs, "
-                "then answers contextual queries using retrieval-augmented generation. "
-                "Called by Coding Agent and PR Reviewer Agent for historical context. "
-                "Available for Team tier and above."
-            ),
-            prompt=_prompt("knowledge_base", "knowledge_base_agent_prompt"),
-            tools=FILE_TOOLS + ["Bash", "Grep"],
-            model=_get_model("knowledge_base"),
+        prompt_file="gitlab_agent_prompt",
+        tools=_get_gitlab_agent_tools,
+    ),
+    "knowledge_base": _AgentSpec(
+        description=(
+            "Knowledge Base Agent for RAG-based project context retrieval. "
+            "Indexes codebase documentation, PR history, and architecture docs, "
+            "then answers contextual queries using retrieval-augmented generation. "
+            "Called by Coding Agent and PR Reviewer Agent for historical context. "
+            "Available for Team tier and above."
         ),
-        "security_reviewer": AgentDefinition(
-            description=(
-                "Security-focused PR reviewer. Reviews PRs touching authentication, "
-                "billing, RBAC, audit trails, SSO, OAuth, tokens, passwords, and "
-                "encryption. Applies OWASP Top 10, Stripe security best practices, "
-                "and GDPR/data privacy patterns. Use instead of pr_reviewer when "
-                "the PR touches: auth/, billing/, rbac/, permissions/, audit/, "
-                "sso/, oauth/, tokens/, passwords/, encryption/."
-            ),
-            prompt=_prompt("security_reviewer", "security_reviewer_agent_prompt"),
-            tools=_get_pr_reviewer_tools(),
-            model=_get_model("security_reviewer"),
+        prompt_file="knowledge_base_agent_prompt",
+        tools=_get_knowledge_base_tools,
+    ),
+    "security_reviewer": _AgentSpec(
+        description=(
+            "Security-focused PR reviewer. Reviews PRs touching authentication, "
+            "billing, RBAC, audit trails, SSO, OAuth, tokens, passwords, and "
+            "encryption. Applies OWASP Top 10, Stripe security best practices, "
+            "and GDPR/data privacy patterns. Use instead of pr_reviewer when "
+            "the PR touches: auth/, billing/, rbac/, permissions/, audit/, "
+            "sso/, oauth/, tokens/, passwords/, encryption/."
         ),
-        "qa": AgentDefinition(
-            description=(
-                "Dedicated QA/testing agent. Writes unit, integration, and E2E tests "
-                "using pytest and Playwright. Runs coverage audits, identifies untested "
-                "code paths, investigates flaky tests, and validates regression suites. "
-                "Use instead of the coding agent when the primary goal is test writing "
-                "or coverage improvement rather than feature implementation."
-            ),
-            prompt=_prompt("qa", "qa_agent_prompt"),
-            tools=get_qa_tools(),
-            model=_get_model("qa"),
+        prompt_file="security_reviewer_agent_prompt",
+        tools=_get_pr_reviewer_tools,
+    ),
+    "qa": _AgentSpec(
+        description=(
+            "Dedicated QA/testing agent. Writes unit, integration, and E2E tests "
+            "using pytest and Playwright. Runs coverage audits, identifies untested "
+            "code paths, investigates flaky tests, and validates regression suites. "
+            "Use instead of the coding agent when the primary goal is test writing "
+            "or coverage improvement rather than feature implementation."
         ),
+        prompt_file="qa_agent_prompt",
+        tools=_get_qa_agent_tools,
+    ),
+}
+
+
+def _build_agent_definition(name: str) -> AgentDefinition:
+    spec = _AGENT_SPECS[name]
+    return AgentDefinition(
+        description=spec.description,
+        prompt=_prompt(name, spec.prompt_file),
+        tools=list(spec.tools()),
+        model=_get_model(name),
+    )
+
+
+def create_agent_definitions() -> dict[str, AgentDefinition]:
+    return {name: _build_agent_definition(name) for name in _AGENT_SPECS}
+
+
+class _AgentRegistry(Mapping[str, AgentDefinition]):
+    """Read-only mapping that builds each agent definition on first access.
+
+    Agent names and descriptions are known up front, but prompt files are
+    only loaded once a given agent is actually looked up.
+    """
+
+    def __init__(self) -> None:
+        self._built: dict[str, AgentDefinition] = {}
+
+    def __getitem__(self, name: str) -> AgentDefinition:
+        try:
+            return self._built[name]
+        except KeyError:
+            pass
+        definition = self._built[name] = _build_agent_definition(name)
+        return definition
+
+    def __contains__(self, name: object) -> bool:
+        return name in _AGENT_SPECS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_AGENT_SPECS)
+
+    def __len__(self) -> int:
+        return len(_AGENT_SPECS)
+
+
+def _copy_agent_definitions() -> dict[str, AgentDefinition]:
+    """Independent copies of the registry's definitions for callers to modify."""
+    return {
+        name: dataclasses.replace(definition, tools=list(definition.tools or ()))
+        for name, definition in AGENT_DEFINITIONS.items()
     }
 
 
@@ -431,7 +555,7 @@ def create_agent_definitions_for_pool(
     Returns:
         Agent definitions dict with the coding agent model overridden.
     """
-    defs = create_agent_definitions()
+    defs = _copy_agent_definitions()
     if coding_model is not None and coding_model in _VALID_MODELS:
         defs["coding"] = AgentDefinition(
             description=defs["coding"].description,
@@ -442,28 +566,93 @@ def create_agent_definitions_for_pool(
     return defs
 
 
-AGENT_DEFINITIONS: dict[str, AgentDefinition] = create_agent_definitions()
-LINEAR_AGENT = AGENT_DEFINITIONS["linear"]
-GITHUB_AGENT = AGENT_DEFINITIONS["github"]
-SLACK_AGENT = AGENT_DEFINITIONS["slack"]
-CODING_AGENT = AGENT_DEFINITIONS["coding"]
-PR_REVIEWER_AGENT = AGENT_DEFINITIONS["pr_reviewer"]
-OPS_AGENT = AGENT_DEFINITIONS["ops"]
-CODING_FAST_AGENT = AGENT_DEFINITIONS["coding_fast"]
-PR_REVIEWER_FAST_AGENT = AGENT_DEFINITIONS["pr_reviewer_fast"]
-CHATGPT_AGENT = AGENT_DEFINITIONS["chatgpt"]
-GEMINI_AGENT = AGENT_DEFINITIONS["gemini"]
-GROQ_AGENT = AGENT_DEFINITIONS["groq"]
-KIMI_AGENT = AGENT_DEFINITIONS["kimi"]
-WINDSURF_AGENT = AGENT_DEFINITIONS["windsurf"]
-OPENROUTER_DEV_AGENT = AGENT_DEFINITIONS["openrouter_dev"]
-PRODUCT_MANAGER_AGENT = AGENT_DEFINITIONS["product_manager"]
-DESIGNER_AGENT = AGENT_DEFINITIONS["designer"]
-JIRA_AGENT = AGENT_DEFINITIONS["jira"]
-GITLAB_AGENT = AGENT_DEFINITIONS["gitlab"]
-KNOWLEDGE_BASE_AGENT = AGENT_DEFINITIONS["knowledge_base"]
-QA_AGENT = AGENT_DEFINITIONS["qa"]
-SECURITY_REVIEWER_AGENT = AGENT_DEFINITIONS["security_reviewer"]
+# Read-only: there is no way to add, replace or remove an agent through the
+# registry, so the built definitions can be shared instead of rebuilt. The
+# AgentDefinition values themselves are mutable and shared process-wide, so
+# the create_agent_definitions_* helpers hand out copies instead.
+_registry = _AgentRegistry()
+AGENT_DEFINITIONS: Final[Mapping[str, AgentDefinition]] = _registry
+
+
+def _reset_caches() -> None:
+    """Forget every per-process cache so definitions are rebuilt on next access.
+
+    Clears the model overrides, the prompt index and contents, the tool
+    groups and the built registry entries. Meant for tests that change
+    *_AGENT_MODEL / ORCHESTRATOR_MODEL or the prompt files.
+    """
+    global _prompt_paths
+    _get_model.cache_clear()
+    get_orchestrator_model.cache_clear()
+    _load_prompt.cache_clear()
+    _prompt_paths = None
+    for spec in _AGENT_SPECS.values():
+        cache_clear = getattr(spec.tools, "cache_clear", None)
+        if cache_clear is not None:
+            cache_clear()
+    _registry._built.clear()
+
+
+# Exported agent constants, mapped to their AGENT_DEFINITIONS key
+_AGENT_CONSTANTS: Final[dict[str, str]] = {
+    "LINEAR_AGENT": "linear",
+    "GITHUB_AGENT": "github",
+    "SLACK_AGENT": "slack",
+    "CODING_AGENT": "coding",
+    "PR_REVIEWER_AGENT": "pr_reviewer",
+    "OPS_AGENT": "ops",
+    "CODING_FAST_AGENT": "coding_fast",
+    "PR_REVIEWER_FAST_AGENT": "pr_reviewer_fast",
+    "CHATGPT_AGENT": "chatgpt",
+    "GEMINI_AGENT": "gemini",
+    "GROQ_AGENT": "groq",
+    "KIMI_AGENT": "kimi",
+    "WINDSURF_AGENT": "windsurf",
+    "OPENROUTER_DEV_AGENT": "openrouter_dev",
+    "PRODUCT_MANAGER_AGENT": "product_manager",
+    "DESIGNER_AGENT": "designer",
+    "JIRA_AGENT": "jira",
+    "GITLAB_AGENT": "gitlab",
+    "KNOWLEDGE_BASE_AGENT": "knowledge_base",
+    "QA_AGENT": "qa",
+    "SECURITY_REVIEWER_AGENT": "security_reviewer",
+}
+
+
+if TYPE_CHECKING:
+    # Declared for type checkers and linters only; at runtime the module
+    # __getattr__ below builds them on first access. Keep in sync with
+    # _AGENT_CONSTANTS.
+    LINEAR_AGENT: AgentDefinition
+    GITHUB_AGENT: AgentDefinition
+    SLACK_AGENT: AgentDefinition
+    CODING_AGENT: AgentDefinition
+    PR_REVIEWER_AGENT: AgentDefinition
+    OPS_AGENT: AgentDefinition
+    CODING_FAST_AGENT: AgentDefinition
+    PR_REVIEWER_FAST_AGENT: AgentDefinition
+    CHATGPT_AGENT: AgentDefinition
+    GEMINI_AGENT: AgentDefinition
+    GROQ_AGENT: AgentDefinition
+    KIMI_AGENT: AgentDefinition
+    WINDSURF_AGENT: AgentDefinition
+    OPENROUTER_DEV_AGENT: AgentDefinition
+    PRODUCT_MANAGER_AGENT: AgentDefinition
+    DESIGNER_AGENT: AgentDefinition
+    JIRA_AGENT: AgentDefinition
+    GITLAB_AGENT: AgentDefinition
+    KNOWLEDGE_BASE_AGENT: AgentDefinition
+    QA_AGENT: AgentDefinition
+    SECURITY_REVIEWER_AGENT: AgentDefinition
+else:
+
+    def __getattr__(name: str) -> AgentDefinition:
+        """Resolve LINEAR_AGENT-style constants on first access (PEP 562)."""
+        try:
+            agent_name = _AGENT_CONSTANTS[name]
+        except KeyError:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+        return AGENT_DEFINITIONS[agent_name]
 
 
 def create_agent_definitions_with_routing(
@@ -523,7 +712,7 @@ def create_agent_definitions_with_routing(
         if pr_reviewer_tier == ModelTier.OPUS:
             pr_reviewer_tier = ModelTier.SONNET
 
-    defs = create_agent_definitions()
+    defs = _copy_agent_definitions()
 
     if coding_tier in (ModelTier.OPUS, ModelTier.SONNET):
         coding_model: ModelOption = coding_tier.value  # type: ignore[assignment]
@@ -247,8 +247,9 @@ def create_client(
     # Use provided system prompt or load the default orchestrator prompt
     orchestrator_prompt = system_prompt if system_prompt is not None else _get_cached_orchestrator_prompt()
 
-    # Use provided agent definitions or fall back to defaults
-    agents = agent_overrides if agent_overrides is not None else AGENT_DEFINITIONS
+    # Use provided agent definitions or fall back to defaults. The SDK takes
+    # a plain dict, so hand it a copy rather than the shared registry.
+    agents = agent_overrides if agent_overrides is not None else dict(AGENT_DEFINITIONS)
 
     # Use provided cwd or fall back to project_dir
     effective_cwd = cwd if cwd is not None else project_dir
@@ -11,6 +11,10 @@ Bootstraps imports so dashboard modules can be tested via standard
 2. **Repo root / CI** — running from the repository root where dashboard/
    is a direct sub-directory.  Python's normal import machinery works, so
    no module patching is needed.
+
+It also moves tests marked slow or io_heavy to the front of the run, so
+pytest-xdist hands the expensive ones out first instead of leaving one
+of them to finish last on a single worker.
 """
 import importlib.util
 import sys
@@ -181,3 +185,12 @@ if _IN_WORKTREE:
             _load_module_from_file("dashboard.crash_isolation", _worktree_crash_isolation_path)
         except Exception:
             pass
+
+
+def pytest_collection_modifyitems(items):
+    """Run slow and io_heavy tests first; the sort is stable otherwise."""
+    items.sort(
+        key=lambda item: not (
+            item.get_closest_marker("slow") or item.get_closest_marker("io_heavy")
+        )
+    )
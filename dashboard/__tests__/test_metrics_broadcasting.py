@@ -3,8 +3,10 @@
 Tests the AgentMetricsCollector's event subscription and broadcasting functionality.
 """
 
+import itertools
 import tempfile
 import time
+import types
 from pathlib import Path
 from typing import List, Tuple
 
@@ -333,8 +335,30 @@ def test_duplicate_subscription_prevention(collector, recorder):
     assert len([cb for cb in collector._event_callbacks if cb == recorder.callback]) == 1
 
 
-def test_event_timing(collector, recorder):
-    """Test that event timing is accurate."""
+def test_event_timing(collector, recorder, monkeypatch):
+    """Test that event duration is the tracker's clock delta."""
+    # The tracker reads the clock once on entry and once on exit
+    ticks = itertools.count(1000.0, 0.25)
+    monkeypatch.setattr(
+        "dashboard.collector.time", types.SimpleNamespace(perf_counter=lambda: next(ticks))
+    )
+    collector.subscribe(recorder.callback)
+
+    session_id = collector.start_session()
+
+    with collector.track_agent("test-agent", "AI-107", "claude-sonnet-4-5", session_id) as tracker:
+        tracker.add_tokens(1000, 2000)
+
+    collector.end_session(session_id)
+
+    completed_events = recorder.get_events_by_type("task_completed")
+    assert len(completed_events) == 1
+    assert completed_events[0]["duration_seconds"] == pytest.approx(0.25)
+
+
+@pytest.mark.slow
+def test_event_timing_wall_clock(collector, recorder):
+    """Test that event timing is accurate against the real clock."""
     collector.subscribe(recorder.callback)
 
     session_id = collector.start_session()
@@ -77,7 +77,8 @@ class AgentTracker:
         self.ticket_key = ticket_key
         self.model_used = model_used
         self.started_at = started_at
-        self.start_time = time.time()
+        # Monotonic clock for the duration; started_at keeps the wall-clock time
+        self.start_time = time.perf_counter()
 
         # Accumulated data
         self.input_tokens = 0
@@ -126,7 +127,7 @@ class AgentTracker:
             Complete AgentEvent with all fields populated
         """
         ended_at = datetime.utcnow().isoformat() + "Z"
-        duration_seconds = time.time() - self.start_time
+        duration_seconds = time.perf_counter() - self.start_time
 
         # Calculate cost
         total_tokens = self.input_tokens + self.output_tokens
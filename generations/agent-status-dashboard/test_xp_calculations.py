@@ -0,0 +1,146 @@
+"""Tests for XP and level calculations.
+
+This module tests xp_calculations, verifying that:
+- Each threshold boundary maps to the right level and title
+- Levels are capped at 8 past the last threshold
+- Speed bonus bands, contribution XP and streak updates follow the rules
+- The batch forms agree with the single-value forms
+"""
+
+import pytest
+
+from xp_calculations import (
+    calculate_level_from_xp,
+    calculate_levels_from_xp,
+    calculate_speed_bonus,
+    calculate_xp_for_contribution_type,
+    get_level_title,
+    update_streak,
+    update_streak_for_statuses,
+)
+
+# (total_xp, expected_level) pairs either side of every threshold
+LEVEL_BOUNDARIES = [
+    (0, 1), (49, 1),
+    (50, 2), (149, 2),
+    (150, 3), (399, 3),
+    (400, 4), (799, 4),
+    (800, 5), (1499, 5),
+    (1500, 6), (2999, 6),
+    (3000, 7), (4999, 7),
+    (5000, 8),
+]
+
+# XP totals past the last threshold
+MAX_LEVEL_XP = [5000, 5001, 10000, 1_000_000]
+
+# (duration_seconds, expected_bonus) either side of each band limit
+SPEED_BONUS_CASES = [
+    (0.0, 10), (15.5, 10), (29.9, 10),
+    (30.0, 5), (45.0, 5), (59.9, 5),
+    (60.0, 0), (120.0, 0), (float("nan"), 0),
+]
+
+CONTRIBUTION_XP = {
+    "commit": 5,
+    "pr_created": 15,
+    "pr_merged": 30,
+    "test_written": 20,
+    "ticket_completed": 25,
+    "file_created": 3,
+    "file_modified": 2,
+    "issue_created": 8,
+}
+
+LEVEL_TITLES = [
+    "Intern", "Junior", "Mid-Level", "Senior",
+    "Staff", "Principal", "Distinguished", "Fellow",
+]
+
+# (previous_streak, previous_status, current_status, best_streak, expected)
+STREAK_CASES = [
+    (0, "success", "success", 0, (1, 1)),
+    (1, "success", "success", 1, (2, 2)),
+    (2, "success", "success", 10, (3, 10)),
+    (0, "error", "success", 4, (1, 4)),
+    (2, "success", "error", 2, (0, 2)),
+    (5, "success", "timeout", 5, (0, 5)),
+    (3, "success", "blocked", 7, (0, 7)),
+]
+
+
+class TestLevelCalculation:
+    """Test level lookup from total XP."""
+
+    @pytest.mark.parametrize("total_xp, expected", LEVEL_BOUNDARIES)
+    def test_level_at_threshold_boundaries(self, total_xp, expected):
+        """Test that XP either side of each threshold maps to the right level."""
+        assert calculate_level_from_xp(total_xp) == expected
+
+    def test_max_level_cap(self):
+        """Test that XP past the last threshold stays at level 8."""
+        assert calculate_levels_from_xp(MAX_LEVEL_XP) == [8] * len(MAX_LEVEL_XP)
+
+    def test_batch_matches_single_value(self):
+        """Test that the batch form returns the same levels in order."""
+        xp_totals = [xp for xp, _ in LEVEL_BOUNDARIES]
+        expected = [level for _, level in LEVEL_BOUNDARIES]
+        assert calculate_levels_from_xp(xp_totals) == expected
+
+    @pytest.mark.parametrize("level, title", list(enumerate(LEVEL_TITLES, start=1)))
+    def test_level_titles(self, level, title):
+        """Test the title for each level."""
+        assert get_level_title(level) == title
+
+    @pytest.mark.parametrize("level", [0, 9, -1])
+    def test_level_title_out_of_range(self, level):
+        """Test that levels outside 1-8 are rejected."""
+        with pytest.raises(ValueError, match="Level must be between 1 and 8"):
+            get_level_title(level)
+
+
+class TestBonuses:
+    """Test speed and contribution XP rules."""
+
+    @pytest.mark.parametrize("duration, expected", SPEED_BONUS_CASES)
+    def test_speed_bonus(self, duration, expected):
+        """Test the speed bonus band for each duration."""
+        assert calculate_speed_bonus(duration) == expected
+
+    @pytest.mark.parametrize("contribution_type, expected", list(CONTRIBUTION_XP.items()))
+    def test_contribution_xp(self, contribution_type, expected):
+        """Test the XP for each contribution type."""
+        assert calculate_xp_for_contribution_type(contribution_type) == expected
+
+    def test_unknown_contribution_type(self):
+        """Test that an unknown contribution type is rejected."""
+        with pytest.raises(ValueError, match="Unknown contribution type: unknown"):
+            calculate_xp_for_contribution_type("unknown")
+
+
+class TestStreakUpdates:
+    """Test streak updates for single and repeated invocations."""
+
+    @pytest.mark.parametrize(
+        "previous_streak, previous_status, current_status, best_streak, expected",
+        STREAK_CASES,
+    )
+    def test_streak_cases(
+        self, previous_streak, previous_status, current_status, best_streak, expected
+    ):
+        """Test that success extends the streak and failure resets it."""
+        assert update_streak(
+            previous_streak, previous_status, current_status, best_streak
+        ) == expected
+
+    def test_batch_matches_repeated_update_streak(self):
+        """Test that the batch form matches applying update_streak per status."""
+        statuses = ["success", "success", "error", "success", "timeout", "success", "success"]
+
+        streak, best = 2, 4
+        previous = "success"
+        for status in statuses:
+            streak, best = update_streak(streak, previous, status, best)
+            previous = status
+
+        assert update_streak_for_statuses(2, 4, statuses) == (streak, best)
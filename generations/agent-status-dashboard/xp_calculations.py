@@ -18,6 +18,52 @@ Level Progression:
 - Thresholds: 0, 50, 150, 400, 800, 1500, 3000, 5000 XP
 """
 
+import bisect
+from collections.abc import Iterable
+from typing import Final, NamedTuple
+
+
+class LevelSpec(NamedTuple):
+    """Minimum XP and title for one level."""
+
+    threshold: int
+    title: str
+
+
+# Levels 1-8 in ascending threshold order
+_LEVELS: Final = (
+    LevelSpec(0, "Intern"),
+    LevelSpec(50, "Junior"),
+    LevelSpec(150, "Mid-Level"),
+    LevelSpec(400, "Senior"),
+    LevelSpec(800, "Staff"),
+    LevelSpec(1500, "Principal"),
+    LevelSpec(3000, "Distinguished"),
+    LevelSpec(5000, "Fellow"),
+)
+
+# Thresholds alone, for bisecting (see get_level_thresholds)
+_LEVEL_THRESHOLDS: Final = tuple(spec.threshold for spec in _LEVELS)
+
+# Speed bonus by duration band: under 30s, under 60s, 60s and over
+_SPEED_BONUS_LIMITS: Final = (30, 60)
+_SPEED_BONUS: Final = (10, 5, 0)
+
+# Invocation statuses that count as a failure for the error-recovery bonus
+_FAILURE_STATUSES: Final = frozenset(("error", "timeout", "blocked"))
+
+# XP per contribution type (see calculate_xp_for_contribution_type)
+_CONTRIBUTION_XP: Final[dict[str, int]] = {
+    "commit": 5,
+    "pr_created": 15,
+    "pr_merged": 30,
+    "test_written": 20,
+    "ticket_completed": 25,
+    "file_created": 3,
+    "file_modified": 2,
+    "issue_created": 8,
+}
+
 
 def calculate_xp_for_successful_invocation(base_xp: int = 10) -> int:
     """Calculate XP for a successful agent invocation.
@@ -70,21 +116,11 @@ def calculate_xp_for_contribution_type(contribution_type: str) -> int:
             ...
         ValueError: Unknown contribution type: unknown
     """
-    contributions = {
-        "commit": 5,
-        "pr_created": 15,
-        "pr_merged": 30,
-        "test_written": 20,
-        "ticket_completed": 25,
-        "file_created": 3,
-        "file_modified": 2,
-        "issue_created": 8,
-    }
-
-    if contribution_type not in contributions:
+    xp = _CONTRIBUTION_XP.get(contribution_type)
+    if xp is None:
         raise ValueError(f"Unknown contribution type: {contribution_type}")
 
-    return contributions[contribution_type]
+    return xp
 
 
 def calculate_speed_bonus(duration_seconds: float) -> int:
@@ -109,12 +145,7 @@ def calculate_speed_bonus(duration_seconds: float) -> int:
         >>> calculate_speed_bonus(120.0)
         0
     """
-    if duration_seconds < 30:
-        return 10
-    elif duration_seconds < 60:
-        return 5
-    else:
-        return 0
+    return _SPEED_BONUS[bisect.bisect_right(_SPEED_BONUS_LIMITS, duration_seconds)]
 
 
 def calculate_error_recovery_bonus(consecutive_successes: int,
@@ -142,7 +173,7 @@ def calculate_error_recovery_bonus(consecutive_successes: int,
         0
     """
     # Recovery bonus if we just recovered from failure
-    if consecutive_successes == 1 and previous_status in ["error", "timeout", "blocked"]:
+    if consecutive_successes == 1 and previous_status in _FAILURE_STATUSES:
         return 10
     return 0
 
@@ -167,7 +198,7 @@ def calculate_streak_bonus(current_streak: int) -> int:
         >>> calculate_streak_bonus(25)
         25
     """
-    return max(0, current_streak)
+    return current_streak if current_streak > 0 else 0
 
 
 def calculate_total_xp_for_success(
@@ -203,12 +234,15 @@ def calculate_total_xp_for_success(
         >>> calculate_total_xp_for_success(duration_seconds=25.0, current_streak=1, previous_status="error")
         31
     """
-    total = base_xp
-    total += calculate_speed_bonus(duration_seconds)
-    total += calculate_error_recovery_bonus(current_streak, previous_status)
-    total += contribution_xp
-    total += calculate_streak_bonus(current_streak)
-    return total
+    # Same rules as calculate_speed_bonus, calculate_error_recovery_bonus and
+    # calculate_streak_bonus, inlined since this runs for every success event
+    speed_bonus = _SPEED_BONUS[bisect.bisect_right(_SPEED_BONUS_LIMITS, duration_seconds)]
+    if current_streak == 1 and previous_status in _FAILURE_STATUSES:
+        recovery_bonus = 10
+    else:
+        recovery_bonus = 0
+    streak_bonus = current_streak if current_streak > 0 else 0
+    return base_xp + speed_bonus + recovery_bonus + contribution_xp + streak_bonus
 
 
 def get_level_thresholds() -> list[int]:
@@ -235,7 +269,7 @@ def get_level_thresholds() -> list[int]:
         >>> len(get_level_thresholds())
         8
     """
-    return [0, 50, 150, 400, 800, 1500, 3000, 5000]
+    return list(_LEVEL_THRESHOLDS)
 
 
 def get_level_title(level: int) -> str:
@@ -260,27 +294,16 @@ def get_level_title(level: int) -> str:
             ...
         ValueError: Level must be between 1 and 8, got 9
     """
-    titles = {
-        1: "Intern",
-        2: "Junior",
-        3: "Mid-Level",
-        4: "Senior",
-        5: "Staff",
-        6: "Principal",
-        7: "Distinguished",
-        8: "Fellow",
-    }
-
     if level < 1 or level > 8:
         raise ValueError(f"Level must be between 1 and 8, got {level}")
 
-    return titles[level]
+    return _LEVELS[level - 1].title
 
 
 def calculate_level_from_xp(total_xp: int) -> int:
     """Calculate the current level based on total XP.
 
-    Uses threshold comparison to find the appropriate level.
+    Uses a binary search over the level thresholds.
 
     Args:
         total_xp: Total XP accumulated
@@ -302,15 +325,30 @@ def calculate_level_from_xp(total_xp: int) -> int:
         >>> calculate_level_from_xp(10000)
         8
     """
-    thresholds = get_level_thresholds()
+    # Number of thresholds <= total_xp; negative XP still counts as level 1
+    return max(1, bisect.bisect_right(_LEVEL_THRESHOLDS, total_xp))
+
+
+def calculate_levels_from_xp(xp_totals: Iterable[int]) -> list[int]:
+    """Calculate the level for each of several XP totals.
+
+    Batch form of calculate_level_from_xp for scoring many agents at once.
+
+    Args:
+        xp_totals: Total XP values, one per agent
 
-    # Iterate backwards through thresholds to find current level
-    for i in range(len(thresholds) - 1, -1, -1):
-        if total_xp >= thresholds[i]:
-            return i + 1
+    Returns:
+        List of levels (1-8) in the same order as xp_totals
 
-    # Should never reach here if thresholds are valid
-    return 1
+    Examples:
+        >>> calculate_levels_from_xp([0, 49, 50, 150, 5000, 10000])
+        [1, 1, 2, 3, 8, 8]
+        >>> calculate_levels_from_xp([])
+        []
+    """
+    bisect_right = bisect.bisect_right
+    thresholds = _LEVEL_THRESHOLDS
+    return [max(1, bisect_right(thresholds, total_xp)) for total_xp in xp_totals]
 
 
 def calculate_xp_for_next_level(total_xp: int) -> int:
@@ -333,14 +371,13 @@ def calculate_xp_for_next_level(total_xp: int) -> int:
         0
     """
     current_level = calculate_level_from_xp(total_xp)
-    thresholds = get_level_thresholds()
 
     # If already at max level, no XP needed
-    if current_level >= len(thresholds):
+    if current_level >= len(_LEVEL_THRESHOLDS):
         return 0
 
     # Next threshold is at index current_level
-    next_threshold = thresholds[current_level]
+    next_threshold = _LEVEL_THRESHOLDS[current_level]
     return max(0, next_threshold - total_xp)
 
 
@@ -366,14 +403,13 @@ def calculate_xp_progress_in_level(total_xp: int) -> tuple[int, int]:
         (50, 100)
     """
     current_level = calculate_level_from_xp(total_xp)
-    thresholds = get_level_thresholds()
 
     # Get the XP range for the current level
-    level_start = thresholds[current_level - 1]
+    level_start = _LEVEL_THRESHOLDS[current_level - 1]
 
     # Get the next level's threshold (if it exists)
-    if current_level < len(thresholds):
-        level_end = thresholds[current_level]
+    if current_level < len(_LEVEL_THRESHOLDS):
+        level_end = _LEVEL_THRESHOLDS[current_level]
     else:
         # Already at max level
         return (0, 0)
@@ -421,3 +457,40 @@ def update_streak(
     else:
         # Failure resets current streak but keeps best streak
         return (0, best_streak)
+
+
+def update_streak_for_statuses(
+    previous_streak: int,
+    best_streak: int,
+    statuses: Iterable[str],
+) -> tuple[int, int]:
+    """Update success streak for a run of invocation outcomes in one pass.
+
+    Batch form of update_streak: equivalent to applying it to each status in
+    order, without building an intermediate tuple per invocation.
+
+    Args:
+        previous_streak: Current streak before the first invocation
+        best_streak: Best streak achieved so far
+        statuses: Statuses of the invocations, oldest first
+
+    Returns:
+        Tuple of (new_current_streak, new_best_streak)
+
+    Examples:
+        >>> update_streak_for_statuses(0, 0, ["success", "success", "error", "success"])
+        (1, 2)
+        >>> update_streak_for_statuses(3, 5, [])
+        (3, 5)
+    """
+    streak = previous_streak
+    best = best_streak
+    for status in statuses:
+        if status == "success":
+            streak += 1
+            if streak > best:
+                best = streak
+        else:
+            # Failure resets current streak but keeps best streak
+            streak = 0
+    return (streak, best)
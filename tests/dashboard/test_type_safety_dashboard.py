@@ -7,6 +7,7 @@ Tests:
 - Runtime type checking for key functions
 """
 
+import functools
 import inspect
 import sys
 import typing
@@ -23,46 +24,61 @@ from dashboard.config import AgentConfig
 from dashboard.provider_bridge import ProviderBridge
 
 
+@functools.cache
+def _hints(obj):
+    """Annotations of obj, resolved once per object for the whole test run.
+
+    Annotations evaluated at definition time are returned as-is; only
+    postponed (string) annotations, e.g. under ``from __future__ import
+    annotations``, go through get_type_hints().
+    """
+    annotations = obj.__annotations__
+    if any(isinstance(hint, str) for hint in annotations.values()):
+        return get_type_hints(obj)
+    return annotations
+
+
+# ---------------------------------------------------------------------------
+# Annotation tests (ParsedIntent, AgentConfig, ProviderBridge.send_message)
+# ---------------------------------------------------------------------------
+
+_EXPECTED_HINTS = [
+    (ParsedIntent, "intent_type", str),
+    (ParsedIntent, "agent", typing.Optional[str]),
+    (ParsedIntent, "action", typing.Optional[str]),
+    (ParsedIntent, "params", dict),
+    (ParsedIntent, "original_message", str),
+    (AgentConfig, "host", str),
+    (AgentConfig, "port", int),
+    (AgentConfig, "linear_api_key", str),
+    (AgentConfig, "anthropic_api_key", str),
+    (AgentConfig, "default_provider", str),
+    (ProviderBridge.send_message, "return", str),
+    (ProviderBridge.send_message, "message", str),
+]
+
+
+class TestTypeHints:
+    """Tests that fields and parameters carry the expected annotations."""
+
+    @pytest.mark.parametrize(
+        "obj, name, expected",
+        _EXPECTED_HINTS,
+        ids=[f"{obj.__qualname__}.{name}" for obj, name, _ in _EXPECTED_HINTS],
+    )
+    def test_annotation(self, obj, name, expected):
+        """Each listed name is annotated with the expected type."""
+        hints = _hints(obj)
+        assert name in hints
+        assert hints[name] == expected
+
+
 # ---------------------------------------------------------------------------
-# ParsedIntent type annotation tests
+# ParsedIntent field tests
 # ---------------------------------------------------------------------------
 
-class TestParsedIntentTypeAnnotations:
-    """Tests for ParsedIntent type annotations."""
-
-    def test_parsed_intent_has_intent_type_annotation(self):
-        """intent_type field has str annotation."""
-        hints = get_type_hints(ParsedIntent)
-        assert "intent_type" in hints
-        assert hints["intent_type"] == str
-
-    def test_parsed_intent_agent_is_optional_str(self):
-        """agent field is Optional[str]."""
-        hints = get_type_hints(ParsedIntent)
-        assert "agent" in hints
-        # Optional[str] = Union[str, None]
-        origin = getattr(hints["agent"], "__origin__", None)
-        # In Python 3.11+, Optional[str] has __origin__ = typing.Union
-        assert origin is typing.Union or hints["agent"] == typing.Optional[str]
-
-    def test_parsed_intent_action_is_optional_str(self):
-        """action field is Optional[str]."""
-        hints = get_type_hints(ParsedIntent)
-        assert "action" in hints
-        origin = getattr(hints["action"], "__origin__", None)
-        assert origin is typing.Union or hints["action"] == typing.Optional[str]
-
-    def test_parsed_intent_params_is_dict(self):
-        """params field is dict."""
-        hints = get_type_hints(ParsedIntent)
-        assert "params" in hints
-        assert hints["params"] == dict
-
-    def test_parsed_intent_original_message_is_str(self):
-        """original_message field is str."""
-        hints = get_type_hints(ParsedIntent)
-        assert "original_message" in hints
-        assert hints["original_message"] == str
+class TestParsedIntentFields:
+    """Tests for ParsedIntent dataclass fields."""
 
     def test_all_expected_fields_present(self):
         """All expected fields are present in ParsedIntent."""
@@ -86,30 +102,20 @@ class TestParseIntentReturnType:
         result = parse_intent("hello")
         assert isinstance(result, ParsedIntent)
 
-    def test_parse_intent_intent_type_is_str(self):
-        """parse_intent() returns ParsedIntent with str intent_type."""
-        result = parse_intent("check AI-1")
-        assert isinstance(result.intent_type, str)
-
-    def test_parse_intent_agent_is_str_or_none(self):
-        """parse_intent() agent is str or None."""
-        result = parse_intent("hello")
-        assert result.agent is None or isinstance(result.agent, str)
-
-    def test_parse_intent_action_is_str_or_none(self):
-        """parse_intent() action is str or None."""
-        result = parse_intent("hello")
-        assert result.action is None or isinstance(result.action, str)
-
-    def test_parse_intent_params_is_dict(self):
-        """parse_intent() params is always a dict."""
-        result = parse_intent("check AI-5")
-        assert isinstance(result.params, dict)
-
-    def test_parse_intent_original_message_is_str(self):
-        """parse_intent() original_message is always a str."""
-        result = parse_intent("test message")
-        assert isinstance(result.original_message, str)
+    @pytest.mark.parametrize(
+        "message, field, types",
+        [
+            ("check AI-1", "intent_type", (str,)),
+            ("hello", "agent", (str, type(None))),
+            ("hello", "action", (str, type(None))),
+            ("check AI-5", "params", (dict,)),
+            ("test message", "original_message", (str,)),
+        ],
+    )
+    def test_parse_intent_field_types(self, message, field, types):
+        """parse_intent() fills each field with a value of its annotated type."""
+        result = parse_intent(message)
+        assert isinstance(getattr(result, field), types)
 
 
 # ---------------------------------------------------------------------------
@@ -119,36 +125,6 @@ class TestParseIntentReturnType:
 class TestAgentConfigTypeAnnotations:
     """Tests for AgentConfig type annotations."""
 
-    def test_agent_config_has_host_annotation(self):
-        """host field is annotated."""
-        hints = get_type_hints(AgentConfig)
-        assert "host" in hints
-        assert hints["host"] == str
-
-    def test_agent_config_has_port_annotation(self):
-        """port field is annotated as int."""
-        hints = get_type_hints(AgentConfig)
-        assert "port" in hints
-        assert hints["port"] == int
-
-    def test_agent_config_has_linear_api_key_annotation(self):
-        """linear_api_key field is str."""
-        hints = get_type_hints(AgentConfig)
-        assert "linear_api_key" in hints
-        assert hints["linear_api_key"] == str
-
-    def test_agent_config_has_anthropic_api_key_annotation(self):
-        """anthropic_api_key field is str."""
-        hints = get_type_hints(AgentConfig)
-        assert "anthropic_api_key" in hints
-        assert hints["anthropic_api_key"] == str
-
-    def test_agent_config_has_default_provider_annotation(self):
-        """default_provider field is str."""
-        hints = get_type_hints(AgentConfig)
-        assert "default_provider" in hints
-        assert hints["default_provider"] == str
-
     def test_agent_config_is_provider_configured_returns_bool(self):
         """is_provider_configured() returns bool at runtime."""
         config = AgentConfig()
@@ -173,18 +149,6 @@ class TestProviderBridgeTypeAnnotations:
         assert hasattr(ProviderBridge, "provider_name")
         assert isinstance(ProviderBridge.provider_name, str)
 
-    def test_provider_bridge_send_message_has_annotations(self):
-        """send_message() has return type annotation."""
-        hints = get_type_hints(ProviderBridge.send_message)
-        assert "return" in hints
-        assert hints["return"] == str
-
-    def test_provider_bridge_send_message_message_param_annotated(self):
-        """send_message() message param is annotated as str."""
-        hints = get_type_hints(ProviderBridge.send_message)
-        assert "message" in hints
-        assert hints["message"] == str
-
     def test_mock_response_is_static_method(self):
         """_mock_response is a static method."""
         assert isinstance(
@@ -9,6 +9,7 @@ Covers acceptance criteria for:
 
 from __future__ import annotations
 
+import functools
 import sys
 import types
 import unittest
@@ -86,6 +87,40 @@ def _prompt_file(name: str) -> Path:
     return PROMPTS_DIR / f"{name}.md"
 
 
+@functools.cache
+def _read_text(path: Path) -> str:
+    """Return the contents of *path*, reading each file once per run."""
+    return path.read_text()
+
+
+@functools.cache
+def _agent_spec_sources(source: str) -> dict[str, str]:
+    """Map each agent name to the source of its _AgentSpec entry in definitions.py.
+
+    Splits *source* in a single pass over its lines instead of searching
+    the whole file once per agent.
+    """
+    specs: dict[str, str] = {}
+    name: str | None = None
+    body: list[str] = []
+    for line in source.splitlines():
+        if name is None:
+            if line.startswith('    "') and line.endswith('": _AgentSpec('):
+                name = line[5:-len('": _AgentSpec(')]
+                body = [line.lstrip()]
+        elif line == "    ),":
+            specs[name] = "\n".join(body)
+            name = None
+        else:
+            body.append(line)
+    return specs
+
+
+def _agent_spec_source(source: str, agent_name: str) -> str:
+    """Return the source of one agent's _AgentSpec entry in definitions.py."""
+    return _agent_spec_sources(source).get(agent_name, "")
+
+
 # ===========================================================================
 # AI-267: jira_agent_prompt.md
 # ===========================================================================
@@ -94,9 +129,11 @@ def _prompt_file(name: str) -> Path:
 class TestJiraAgentPromptFile(unittest.TestCase):
     """jira_agent_prompt.md exists and contains required Jira-specific content."""
 
-    def setUp(self) -> None:
-        self.path = _prompt_file("jira_agent_prompt")
-        self.content = self.path.read_text()
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.path = _prompt_file("jira_agent_prompt")
+        cls.content = _read_text(cls.path)
+        cls.content_lower = cls.content.lower()
 
     def test_file_exists(self) -> None:
         self.assertTrue(self.path.exists(), "jira_agent_prompt.md must exist")
@@ -106,16 +143,12 @@ class TestJiraAgentPromptFile(unittest.TestCase):
 
     def test_contains_jira_terminology(self) -> None:
         """Must mention Jira-native concepts."""
-        for term in ["Epic", "Story", "JQL", "Merge Request"]:
-            # JQL is Jira-specific; 'Merge Request' appears here as a note that MR != PR
-            pass  # Terms vary by section; check the important ones below
-
         # JQL must be present (distinguishes from Linear prompt)
         self.assertIn("JQL", self.content, "Jira prompt must document JQL query language")
 
     def test_contains_jql_section(self) -> None:
         self.assertIn("JQL", self.content)
-        self.assertIn("jql", self.content.lower())
+        self.assertIn("jql", self.content_lower)
 
     def test_contains_issue_hierarchy(self) -> None:
         """Epic > Story > Sub-task hierarchy must be documented."""
@@ -124,20 +157,20 @@ class TestJiraAgentPromptFile(unittest.TestCase):
         self.assertIn("Sub-task", self.content)
 
     def test_contains_webhook_guidance(self) -> None:
-        self.assertIn("webhook", self.content.lower())
+        self.assertIn("webhook", self.content_lower)
 
     def test_contains_atlassian_api_patterns(self) -> None:
-        self.assertIn("atlassian", self.content.lower())
+        self.assertIn("atlassian", self.content_lower)
 
     def test_contains_bidirectional_sync(self) -> None:
-        self.assertIn("sync", self.content.lower())
+        self.assertIn("sync", self.content_lower)
 
     def test_contains_git_identity(self) -> None:
         self.assertIn("jira-agent@claude-agents.dev", self.content)
 
     def test_does_not_reuse_linear_prompt(self) -> None:
         """The jira prompt must be distinct from the linear prompt."""
-        linear_content = _prompt_file("linear_agent_prompt").read_text()
+        linear_content = _read_text(_prompt_file("linear_agent_prompt"))
         # The Jira prompt should have substantially different content
         # (they should share < 30% of lines if they're truly distinct)
         jira_lines = set(self.content.splitlines())
@@ -160,9 +193,11 @@ class TestJiraAgentPromptFile(unittest.TestCase):
 class TestGitLabAgentPromptFile(unittest.TestCase):
     """gitlab_agent_prompt.md exists and contains required GitLab-specific content."""
 
-    def setUp(self) -> None:
-        self.path = _prompt_file("gitlab_agent_prompt")
-        self.content = self.path.read_text()
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.path = _prompt_file("gitlab_agent_prompt")
+        cls.content = _read_text(cls.path)
+        cls.content_lower = cls.content.lower()
 
     def test_file_exists(self) -> None:
         self.assertTrue(self.path.exists(), "gitlab_agent_prompt.md must exist")
@@ -176,14 +211,14 @@ class TestGitLabAgentPromptFile(unittest.TestCase):
 
     def test_mentions_pipeline(self) -> None:
         """GitLab CI/CD pipelines are first-class concepts."""
-        self.assertIn("pipeline", self.content.lower())
+        self.assertIn("pipeline", self.content_lower)
         self.assertIn("Pipeline", self.content)
 
     def test_contains_namespace_concept(self) -> None:
-        self.assertIn("namespace", self.content.lower())
+        self.assertIn("namespace", self.content_lower)
 
     def test_contains_gitlab_api_patterns(self) -> None:
-        self.assertIn("gitlab.com/api", self.content.lower())
+        self.assertIn("gitlab.com/api", self.content_lower)
 
     def test_mentions_protected_branches(self) -> None:
         self.assertIn("rotected branch", self.content)
@@ -201,7 +236,7 @@ class TestGitLabAgentPromptFile(unittest.TestCase):
 
     def test_does_not_reuse_github_prompt(self) -> None:
         """The gitlab prompt must be distinct from the github prompt."""
-        github_content = _prompt_file("github_agent_prompt").read_text()
+        github_content = _read_text(_prompt_file("github_agent_prompt"))
         gitlab_lines = set(self.content.splitlines())
         github_lines = set(github_content.splitlines())
         overlap = len(gitlab_lines & github_lines)
@@ -222,9 +257,11 @@ class TestGitLabAgentPromptFile(unittest.TestCase):
 class TestKnowledgeBaseAgentPromptFile(unittest.TestCase):
     """knowledge_base_agent_prompt.md exists and the agent definition loads it."""
 
-    def setUp(self) -> None:
-        self.path = _prompt_file("knowledge_base_agent_prompt")
-        self.content = self.path.read_text()
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.path = _prompt_file("knowledge_base_agent_prompt")
+        cls.content = _read_text(cls.path)
+        cls.content_lower = cls.content.lower()
 
     def test_file_exists(self) -> None:
         self.assertTrue(self.path.exists(), "knowledge_base_agent_prompt.md must exist")
@@ -236,17 +273,17 @@ class TestKnowledgeBaseAgentPromptFile(unittest.TestCase):
         self.assertIn("RAG", self.content)
 
     def test_contains_chunking_guidance(self) -> None:
-        self.assertIn("chunk", self.content.lower())
+        self.assertIn("chunk", self.content_lower)
 
     def test_contains_similarity_search(self) -> None:
-        self.assertIn("similarity", self.content.lower())
+        self.assertIn("similarity", self.content_lower)
 
     def test_contains_citation_format(self) -> None:
-        self.assertIn("cite", self.content.lower())
+        self.assertIn("cite", self.content_lower)
 
     def test_contains_source_priority(self) -> None:
         """Prompt must document source priority for retrieval."""
-        self.assertIn("priority", self.content.lower())
+        self.assertIn("priority", self.content_lower)
 
     def test_contains_git_identity(self) -> None:
         self.assertIn("knowledge-base-agent@claude-agents.dev", self.content)
@@ -254,7 +291,7 @@ class TestKnowledgeBaseAgentPromptFile(unittest.TestCase):
     def test_definition_uses_prompt_file(self) -> None:
         """definitions.py must load from file, not use an inline string."""
         definitions_path = REPO_ROOT / "agents" / "definitions.py"
-        definitions_source = definitions_path.read_text()
+        definitions_source = _read_text(definitions_path)
 
         # The inline string should no longer be present
         self.assertNotIn(
@@ -265,15 +302,15 @@ class TestKnowledgeBaseAgentPromptFile(unittest.TestCase):
 
         # The new file-based loading should be present
         self.assertIn(
-            "_prompt(\"knowledge_base\", \"knowledge_base_agent_prompt\")",
-            definitions_source,
-            "definitions.py must load knowledge_base prompt from file via _prompt()",
+            'prompt_file="knowledge_base_agent_prompt"',
+            _agent_spec_source(definitions_source, "knowledge_base"),
+            "definitions.py must load knowledge_base prompt from file via its _AgentSpec",
         )
 
     def test_grep_tool_added_to_knowledge_base_tools(self) -> None:
         """Grep tool should be available to the knowledge_base agent for searching."""
         definitions_path = REPO_ROOT / "agents" / "definitions.py"
-        definitions_source = definitions_path.read_text()
+        definitions_source = _read_text(definitions_path)
         # Check that Grep is included in knowledge_base tools
         # The definition includes FILE_TOOLS + ["Bash", "Grep"]
         self.assertIn('"Grep"', definitions_source)
@@ -287,10 +324,12 @@ class TestKnowledgeBaseAgentPromptFile(unittest.TestCase):
 class TestSecurityReviewerAgentDefinition(unittest.TestCase):
     """security_reviewer agent is registered in definitions.py with correct config."""
 
-    def setUp(self) -> None:
-        self.definitions_source = (REPO_ROOT / "agents" / "definitions.py").read_text()
-        self.prompt_path = _prompt_file("security_reviewer_agent_prompt")
-        self.prompt_content = self.prompt_path.read_text()
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.definitions_source = _read_text(REPO_ROOT / "agents" / "definitions.py")
+        cls.prompt_path = _prompt_file("security_reviewer_agent_prompt")
+        cls.prompt_content = _read_text(cls.prompt_path)
+        cls.prompt_content_lower = cls.prompt_content.lower()
 
     def test_security_reviewer_registered_in_definitions(self) -> None:
         """security_reviewer key must exist in the definitions dict."""
@@ -323,24 +362,24 @@ class TestSecurityReviewerAgentDefinition(unittest.TestCase):
         self.assertIn("OWASP", self.definitions_source)
 
     def test_security_reviewer_loads_prompt_from_file(self) -> None:
-        """definitions.py must use _prompt() to load security_reviewer prompt."""
+        """definitions.py must load the security_reviewer prompt from its file."""
         self.assertIn(
-            '_prompt("security_reviewer", "security_reviewer_agent_prompt")',
-            self.definitions_source,
-            "definitions.py must load security_reviewer prompt via _prompt()",
+            'prompt_file="security_reviewer_agent_prompt"',
+            _agent_spec_source(self.definitions_source, "security_reviewer"),
+            "definitions.py must load security_reviewer prompt via its _AgentSpec",
         )
 
     def test_security_reviewer_uses_pr_reviewer_tools(self) -> None:
         """security_reviewer should use _get_pr_reviewer_tools() for GitHub access."""
         self.assertIn(
-            "_get_pr_reviewer_tools()",
-            self.definitions_source,
+            "tools=_get_pr_reviewer_tools,",
+            _agent_spec_source(self.definitions_source, "security_reviewer"),
         )
 
     def test_security_reviewer_exported_as_constant(self) -> None:
         """SECURITY_REVIEWER_AGENT must be exported as a module-level constant."""
         self.assertIn(
-            'SECURITY_REVIEWER_AGENT = AGENT_DEFINITIONS["security_reviewer"]',
+            '"SECURITY_REVIEWER_AGENT": "security_reviewer"',
             self.definitions_source,
             "SECURITY_REVIEWER_AGENT must be exported from definitions.py",
         )
@@ -353,13 +392,13 @@ class TestSecurityReviewerAgentDefinition(unittest.TestCase):
 
     def test_security_reviewer_prompt_contains_stripe_checks(self) -> None:
         self.assertIn("Stripe", self.prompt_content)
-        self.assertIn("idempotency", self.prompt_content.lower())
+        self.assertIn("idempotency", self.prompt_content_lower)
 
     def test_security_reviewer_prompt_contains_jwt_checks(self) -> None:
         self.assertIn("JWT", self.prompt_content)
 
     def test_security_reviewer_prompt_contains_audit_trail(self) -> None:
-        self.assertIn("audit", self.prompt_content.lower())
+        self.assertIn("audit", self.prompt_content_lower)
 
     def test_security_reviewer_prompt_contains_gdpr(self) -> None:
         self.assertIn("GDPR", self.prompt_content)
@@ -372,7 +411,7 @@ class TestSecurityReviewerAgentDefinition(unittest.TestCase):
     def test_orchestrator_prompt_mentions_security_reviewer(self) -> None:
         """Orchestrator prompt must route to security_reviewer for sensitive PRs."""
         orchestrator_path = PROMPTS_DIR / "orchestrator_prompt.md"
-        orchestrator_content = orchestrator_path.read_text()
+        orchestrator_content = _read_text(orchestrator_path)
         self.assertIn(
             "security_reviewer",
             orchestrator_content,
@@ -382,7 +421,7 @@ class TestSecurityReviewerAgentDefinition(unittest.TestCase):
     def test_orchestrator_prompt_lists_routing_paths(self) -> None:
         """Orchestrator must specify which paths trigger security_reviewer."""
         orchestrator_path = PROMPTS_DIR / "orchestrator_prompt.md"
-        orchestrator_content = orchestrator_path.read_text()
+        orchestrator_content = _read_text(orchestrator_path)
         self.assertIn("auth/", orchestrator_content)
         self.assertIn("billing/", orchestrator_content)
 
@@ -400,38 +439,41 @@ class TestAllPromptsLoad(unittest.TestCase):
 
     def test_jira_prompt_has_jql(self) -> None:
         """Jira prompt distinctively includes JQL query language."""
-        content = _prompt_file("jira_agent_prompt").read_text()
+        content = _read_text(_prompt_file("jira_agent_prompt"))
         self.assertIn("JQL", content)
 
     def test_gitlab_prompt_has_merge_request(self) -> None:
         """GitLab prompt uses Merge Request terminology."""
-        content = _prompt_file("gitlab_agent_prompt").read_text()
+        content = _read_text(_prompt_file("gitlab_agent_prompt"))
         self.assertIn("Merge Request", content)
 
     def test_knowledge_base_prompt_has_rag(self) -> None:
         """Knowledge base prompt has RAG guidance."""
-        content = _prompt_file("knowledge_base_agent_prompt").read_text()
+        content = _read_text(_prompt_file("knowledge_base_agent_prompt"))
         self.assertIn("RAG", content)
 
     def test_security_reviewer_prompt_has_owasp(self) -> None:
         """Security reviewer prompt has OWASP guidance."""
-        content = _prompt_file("security_reviewer_agent_prompt").read_text()
+        content = _read_text(_prompt_file("security_reviewer_agent_prompt"))
         self.assertIn("OWASP", content)
 
     def test_jira_definition_uses_jira_prompt(self) -> None:
         """definitions.py jira entry must load jira_agent_prompt."""
-        source = (REPO_ROOT / "agents" / "definitions.py").read_text()
-        self.assertIn('_prompt("jira", "jira_agent_prompt")', source)
+        source = _read_text(REPO_ROOT / "agents" / "definitions.py")
+        self.assertIn('prompt_file="jira_agent_prompt"', _agent_spec_source(source, "jira"))
 
     def test_gitlab_definition_uses_gitlab_prompt(self) -> None:
         """definitions.py gitlab entry must load gitlab_agent_prompt."""
-        source = (REPO_ROOT / "agents" / "definitions.py").read_text()
-        self.assertIn('_prompt("gitlab", "gitlab_agent_prompt")', source)
+        source = _read_text(REPO_ROOT / "agents" / "definitions.py")
+        self.assertIn('prompt_file="gitlab_agent_prompt"', _agent_spec_source(source, "gitlab"))
 
     def test_knowledge_base_definition_uses_file_prompt(self) -> None:
-        """definitions.py knowledge_base entry must use _prompt() not inline string."""
-        source = (REPO_ROOT / "agents" / "definitions.py").read_text()
-        self.assertIn('_prompt("knowledge_base", "knowledge_base_agent_prompt")', source)
+        """definitions.py knowledge_base entry must load its prompt file, not an inline string."""
+        source = _read_text(REPO_ROOT / "agents" / "definitions.py")
+        self.assertIn(
+            'prompt_file="knowledge_base_agent_prompt"',
+            _agent_spec_source(source, "knowledge_base"),
+        )
         self.assertNotIn(
             '"You are the Knowledge Base Agent. You maintain',
             source,
@@ -439,10 +481,10 @@ class TestAllPromptsLoad(unittest.TestCase):
 
     def test_security_reviewer_definition_uses_security_prompt(self) -> None:
         """definitions.py security_reviewer entry must load security_reviewer_agent_prompt."""
-        source = (REPO_ROOT / "agents" / "definitions.py").read_text()
+        source = _read_text(REPO_ROOT / "agents" / "definitions.py")
         self.assertIn(
-            '_prompt("security_reviewer", "security_reviewer_agent_prompt")',
-            source,
+            'prompt_file="security_reviewer_agent_prompt"',
+            _agent_spec_source(source, "security_reviewer"),
         )
 
 
@@ -376,12 +376,19 @@ class TestGenerateApiDocsScript:
     def script_path(self):
         return PROJECT_ROOT / "scripts" / "generate_api_docs.sh"
 
-    def test_script_exists(self, script_path):
-        assert script_path.exists(), "scripts/generate_api_docs.sh does not exist"
-        assert script_path.is_file()
-
-    def test_script_is_executable(self, script_path):
-        mode = script_path.stat().st_mode
+    @pytest.fixture(scope="class")
+    def script_stat(self, script_path):
+        """One os.stat() result shared by the existence and mode checks."""
+        try:
+            return script_path.stat()
+        except FileNotFoundError:
+            pytest.fail("scripts/generate_api_docs.sh does not exist")
+
+    def test_script_exists(self, script_stat):
+        assert stat.S_ISREG(script_stat.st_mode)
+
+    def test_script_is_executable(self, script_stat):
+        mode = script_stat.st_mode
         assert bool(mode & (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)), (
             "scripts/generate_api_docs.sh is not executable"
         )
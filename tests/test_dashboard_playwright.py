@@ -18,6 +18,7 @@ from pathlib import Path
 
 import pytest
 import pytest_asyncio
+pytest.importorskip("playwright.async_api")
 from playwright.async_api import async_playwright, Page, expect
 
 # Add project root to path
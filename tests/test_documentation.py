@@ -5,13 +5,114 @@ Unit Tests for Documentation Generation
 Comprehensive tests for documentation generation utilities.
 """
 
+import functools
 import os
+import re
 import shutil
 import subprocess
 import tempfile
 from pathlib import Path
 import pytest
 
+# Files that must exist in docs/
+_REQUIRED_DOC_FILES = ("DEVELOPER_GUIDE.md", "BRIDGE_INTERFACE.md", "DEPLOYMENT.md")
+
+# Modules pdoc must be able to import
+_PDOC_MODULES = ("client", "security", "prompts", "progress")
+
+# Top-level modules checked for docstrings; the public-API subset must
+# document every public function
+_CORE_MODULES = ("client.py", "agent.py", "security.py", "prompts.py", "progress.py")
+_PUBLIC_API_MODULES = ("prompts.py", "progress.py")
+
+# Topics the developer guide must cover
+_DEVELOPER_GUIDE_TOPICS = (
+    "Getting Started",
+    "Architecture",
+    "Examples",
+    "Testing",
+    "Security",
+)
+
+# Sections the docs index page must link to
+_INDEX_KEY_LINKS = ("DEVELOPER_GUIDE", "BRIDGE_INTERFACE", "api")
+
+# Markdown links [text](path)
+_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+
+# Concepts BRIDGE_INTERFACE.md must cover, matched in one case-insensitive pass
+_BRIDGE_CONCEPTS = ("session", "response", "bridge", "example")
+_BRIDGE_CONCEPT_RE = re.compile("|".join(_BRIDGE_CONCEPTS), re.IGNORECASE)
+
+# Google-style docstring section headers
+_DOCSTRING_SECTIONS = ("Args:", "Returns:", "Raises:", "Example:")
+
+# Everything the accessibility tests look for in docs/html/index.html. The
+# lookahead lets matches overlap, so one scan finds every marker present.
+_INDEX_HTML_MARKERS = (
+    "<!DOCTYPE html>", "<html", "<head>", "<body>", "<title>",
+    'charset="UTF-8"', "viewport", "<a href=",
+) + _INDEX_KEY_LINKS
+_INDEX_HTML_MARKER_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, _INDEX_HTML_MARKERS)) + "))"
+)
+
+
+def _python_blocks(content):
+    """Yield the body of each ```python fenced block in *content*.
+
+    Walks the lines once, so the cost stays linear in the document size
+    however the fences are arranged.
+    """
+    lines = content.split("\n")
+    i = 0
+    while i < len(lines):
+        if lines[i].endswith("```python"):
+            end = i + 1
+            while end < len(lines) and not lines[end].startswith("```"):
+                end += 1
+            if end == len(lines):
+                return
+            yield "\n".join(lines[i + 1:end])
+            i = end + 1
+        else:
+            i += 1
+
+
+@pytest.fixture(scope="session")
+def read_doc():
+    """Return a reader that loads each file at most once per session."""
+    @functools.cache
+    def read(path: Path) -> str:
+        return path.read_bytes().decode("utf-8")
+
+    return read
+
+
+@pytest.fixture(scope="session")
+def developer_guide(read_doc):
+    """Lower-cased developer guide text, shared by the section checks."""
+    guide_path = Path(__file__).parent.parent / "docs" / "DEVELOPER_GUIDE.md"
+    if not guide_path.exists():
+        pytest.skip("Developer guide not found")
+
+    return read_doc(guide_path).lower()
+
+
+@pytest.fixture(scope="session")
+def index_html_markers(read_doc):
+    """The _INDEX_HTML_MARKERS present in the generated docs index page."""
+    html_dir = Path(__file__).parent.parent / "docs" / "html"
+
+    if not html_dir.exists():
+        pytest.skip("HTML documentation not generated")
+
+    index_file = html_dir / "index.html"
+    if not index_file.exists():
+        pytest.skip("index.html not found")
+
+    return frozenset(_INDEX_HTML_MARKER_RE.findall(read_doc(index_file)))
+
 
 class TestDocumentationGeneration:
     """Test documentation generation functionality."""
@@ -40,42 +141,42 @@ class TestDocumentationGeneration:
         assert script_path.exists(), "convert_docs.py should exist"
         assert script_path.is_file(), "convert_docs.py should be a file"
 
-    def test_developer_guide_exists(self, project_root):
+    def test_developer_guide_exists(self, project_root, read_doc):
         """Test that developer guide documentation exists."""
         guide_path = project_root / "docs" / "DEVELOPER_GUIDE.md"
         assert guide_path.exists(), "DEVELOPER_GUIDE.md should exist"
 
-        content = guide_path.read_text()
+        content = read_doc(guide_path)
         assert len(content) > 1000, "Developer guide should have substantial content"
         assert "Table of Contents" in content, "Should have table of contents"
         assert "Getting Started" in content, "Should have getting started section"
         assert "Examples" in content or "Example" in content, "Should have examples"
 
-    def test_bridge_interface_docs_exists(self, project_root):
+    def test_bridge_interface_docs_exists(self, project_root, read_doc):
         """Test that bridge interface documentation exists."""
         bridge_docs = project_root / "docs" / "BRIDGE_INTERFACE.md"
         assert bridge_docs.exists(), "BRIDGE_INTERFACE.md should exist"
 
-        content = bridge_docs.read_text()
+        content = read_doc(bridge_docs)
         assert len(content) > 1000, "Bridge docs should have substantial content"
         assert "interface" in content.lower(), "Should discuss interface"
         assert "Example" in content, "Should have examples"
 
-    def test_deployment_guide_exists(self, project_root):
+    def test_deployment_guide_exists(self, project_root, read_doc):
         """Test that deployment guide exists."""
         deploy_guide = project_root / "docs" / "DEPLOYMENT.md"
         assert deploy_guide.exists(), "DEPLOYMENT.md should exist"
 
-        content = deploy_guide.read_text()
+        content = read_doc(deploy_guide)
         assert "GitHub Pages" in content, "Should cover GitHub Pages"
         assert "deployment" in content.lower(), "Should discuss deployment"
 
-    def test_github_actions_workflow_exists(self, project_root):
+    def test_github_actions_workflow_exists(self, project_root, read_doc):
         """Test that GitHub Actions workflow for docs exists."""
         workflow_path = project_root / ".github" / "workflows" / "docs.yml"
         assert workflow_path.exists(), "docs.yml workflow should exist"
 
-        content = workflow_path.read_text()
+        content = read_doc(workflow_path)
         assert "pdoc" in content, "Workflow should use pdoc"
         assert "deploy" in content.lower(), "Workflow should deploy"
 
@@ -85,13 +186,7 @@ class TestDocumentationGeneration:
         assert docs_dir.exists(), "docs/ directory should exist"
 
         # Check for key files
-        required_files = [
-            "DEVELOPER_GUIDE.md",
-            "BRIDGE_INTERFACE.md",
-            "DEPLOYMENT.md",
-        ]
-
-        for filename in required_files:
+        for filename in _REQUIRED_DOC_FILES:
             file_path = docs_dir / filename
             assert file_path.exists(), f"{filename} should exist in docs/"
 
@@ -121,14 +216,7 @@ class TestDocumentationGeneration:
 
         try:
             # These modules should be importable for pdoc
-            import_tests = [
-                "client",
-                "security",
-                "prompts",
-                "progress",
-            ]
-
-            for module_name in import_tests:
+            for module_name in _PDOC_MODULES:
                 try:
                     __import__(module_name)
                 except ImportError as e:
@@ -145,21 +233,14 @@ class TestDocumentationGeneration:
             while str(project_root / "scripts") in sys.path:
                 sys.path.remove(str(project_root / "scripts"))
 
-    def test_docstrings_present_in_core_modules(self, project_root):
+    def test_docstrings_present_in_core_modules(self, project_root, read_doc):
         """Test that core modules have docstrings."""
-        modules_to_check = [
-            project_root / "client.py",
-            project_root / "agent.py",
-            project_root / "security.py",
-            project_root / "prompts.py",
-            project_root / "progress.py",
-        ]
-
-        for module_path in modules_to_check:
+        for module_name in _CORE_MODULES:
+            module_path = project_root / module_name
             if not module_path.exists():
                 continue
 
-            content = module_path.read_text()
+            content = read_doc(module_path)
 
             # Check for module-level docstring
             assert '"""' in content or "'''" in content, \
@@ -167,41 +248,32 @@ class TestDocumentationGeneration:
 
             # Check for function docstrings (should have Args, Returns, etc.)
             if "def " in content:
-                # Simple heuristic: look for docstring patterns
-                has_docs = any([
-                    "Args:" in content,
-                    "Returns:" in content,
-                    "Raises:" in content,
-                    "Example:" in content,
-                ])
+                # Simple heuristic: look for docstring patterns, stopping at
+                # the first section header found
+                has_docs = any(section in content for section in _DOCSTRING_SECTIONS)
                 assert has_docs, \
                     f"{module_path.name} should have documented functions"
 
-    def test_examples_in_docstrings(self, project_root):
+    def test_examples_in_docstrings(self, project_root, read_doc):
         """Test that docstrings include examples."""
         # Check client.py for examples
         client_file = project_root / "client.py"
         if client_file.exists():
-            content = client_file.read_text()
+            content = read_doc(client_file)
             # Should have example usage
             assert "Example:" in content or "example" in content.lower(), \
                 "client.py should have usage examples"
 
-    def test_all_public_functions_documented(self, project_root):
+    def test_all_public_functions_documented(self, project_root, read_doc):
         """Test that public functions have docstrings."""
         import ast
 
-        files_to_check = [
-            project_root / "prompts.py",
-            project_root / "progress.py",
-        ]
-
-        for file_path in files_to_check:
+        for module_name in _PUBLIC_API_MODULES:
+            file_path = project_root / module_name
             if not file_path.exists():
                 continue
 
-            with open(file_path) as f:
-                tree = ast.parse(f.read())
+            tree = ast.parse(read_doc(file_path))
 
             for node in ast.walk(tree):
                 if isinstance(node, ast.FunctionDef):
@@ -213,12 +285,12 @@ class TestDocumentationGeneration:
                         assert len(docstring) > 10, \
                             f"Docstring for {node.name} should be substantial"
 
-    def test_requirements_includes_doc_deps(self, project_root):
+    def test_requirements_includes_doc_deps(self, project_root, read_doc):
         """Test that requirements.txt includes documentation dependencies."""
         req_file = project_root / "requirements.txt"
         assert req_file.exists(), "requirements.txt should exist"
 
-        content = req_file.read_text()
+        content = read_doc(req_file)
         assert "pdoc" in content.lower(), "Should include pdoc"
         assert "markdown" in content.lower(), "Should include markdown"
 
@@ -238,16 +310,14 @@ class TestDocumentationGeneration:
         if api_dir.exists():
             assert (api_dir / "index.html").exists(), "Should have API index"
 
-    def test_documentation_links_valid(self, project_root):
+    def test_documentation_links_valid(self, project_root, read_doc):
         """Test that internal documentation links are valid."""
         docs_dir = project_root / "docs"
 
         for md_file in docs_dir.glob("*.md"):
-            content = md_file.read_text()
+            content = read_doc(md_file)
 
-            # Extract markdown links [text](path)
-            import re
-            links = re.findall(r'\[([^\]]+)\]\(([^)]+)\)', content)
+            links = _LINK_RE.findall(content)
 
             for link_text, link_path in links:
                 # Skip external links
@@ -278,66 +348,36 @@ class TestDocumentationContent:
         """Get project root directory."""
         return Path(__file__).parent.parent
 
-    def test_developer_guide_completeness(self, project_root):
-        """Test that developer guide covers all required topics."""
-        guide_path = project_root / "docs" / "DEVELOPER_GUIDE.md"
-        if not guide_path.exists():
-            pytest.skip("Developer guide not found")
-
-        content = guide_path.read_text()
-
-        required_sections = [
-            "Getting Started",
-            "Architecture",
-            "Examples",
-            "Testing",
-            "Security",
-        ]
+    @pytest.mark.parametrize("section", _DEVELOPER_GUIDE_TOPICS)
+    def test_developer_guide_completeness(self, developer_guide, section):
+        """Test that developer guide covers each required topic."""
+        assert section.lower() in developer_guide, \
+            f"Developer guide should cover: {section}"
 
-        for section in required_sections:
-            assert section.lower() in content.lower(), \
-                f"Developer guide should cover: {section}"
-
-    def test_bridge_interface_has_examples(self, project_root):
+    def test_bridge_interface_has_examples(self, project_root, read_doc):
         """Test that bridge interface documentation has code examples."""
         bridge_docs = project_root / "docs" / "BRIDGE_INTERFACE.md"
         if not bridge_docs.exists():
             pytest.skip("Bridge interface docs not found")
 
-        content = bridge_docs.read_text()
+        content = read_doc(bridge_docs)
 
         # Should have code blocks
         assert "```python" in content, "Should have Python code examples"
 
         # Should cover key concepts
-        key_concepts = [
-            "session",
-            "response",
-            "bridge",
-            "example",
-        ]
-
-        for concept in key_concepts:
-            assert concept.lower() in content.lower(), \
-                f"Bridge docs should cover: {concept}"
-
-    def test_code_examples_syntax_valid(self, project_root):
-        """Test that code examples in docs have valid syntax."""
-        import re
+        covered = {m.lower() for m in _BRIDGE_CONCEPT_RE.findall(content)}
+        missing = set(_BRIDGE_CONCEPTS) - covered
+        assert not missing, f"Bridge docs should cover: {sorted(missing)}"
 
+    def test_code_examples_syntax_valid(self, project_root, read_doc):
+        """Test that code examples in docs have valid syntax."""
         docs_dir = project_root / "docs"
 
         for md_file in docs_dir.glob("*.md"):
-            content = md_file.read_text()
+            content = read_doc(md_file)
 
-            # Extract Python code blocks
-            python_blocks = re.findall(
-                r'```python\n(.*?)\n```',
-                content,
-                re.DOTALL
-            )
-
-            for i, code_block in enumerate(python_blocks):
+            for i, code_block in enumerate(_python_blocks(content)):
                 # Try to compile the code
                 try:
                     compile(code_block, f"{md_file.name}_example_{i}", 'exec')
@@ -354,60 +394,27 @@ class TestDocumentationContent:
 class TestDocumentationAccessibility:
     """Test documentation accessibility and usability."""
 
-    @pytest.fixture
-    def project_root(self):
-        """Get project root directory."""
-        return Path(__file__).parent.parent
-
-    def test_html_has_valid_structure(self, project_root):
+    def test_html_has_valid_structure(self, index_html_markers):
         """Test that generated HTML has valid structure."""
-        html_dir = project_root / "docs" / "html"
-
-        if not html_dir.exists():
-            pytest.skip("HTML documentation not generated")
-
-        index_file = html_dir / "index.html"
-        if not index_file.exists():
-            pytest.skip("index.html not found")
-
-        content = index_file.read_text()
-
         # Basic HTML structure
-        assert "<!DOCTYPE html>" in content, "Should have DOCTYPE"
-        assert "<html" in content, "Should have html tag"
-        assert "<head>" in content, "Should have head tag"
-        assert "<body>" in content, "Should have body tag"
-        assert "<title>" in content, "Should have title"
+        assert "<!DOCTYPE html>" in index_html_markers, "Should have DOCTYPE"
+        assert "<html" in index_html_markers, "Should have html tag"
+        assert "<head>" in index_html_markers, "Should have head tag"
+        assert "<body>" in index_html_markers, "Should have body tag"
+        assert "<title>" in index_html_markers, "Should have title"
 
         # Accessibility
-        assert 'charset="UTF-8"' in content, "Should have charset"
-        assert 'viewport' in content, "Should have viewport meta tag"
+        assert 'charset="UTF-8"' in index_html_markers, "Should have charset"
+        assert 'viewport' in index_html_markers, "Should have viewport meta tag"
 
-    def test_documentation_has_navigation(self, project_root):
+    def test_documentation_has_navigation(self, index_html_markers):
         """Test that documentation has navigation links."""
-        html_dir = project_root / "docs" / "html"
-
-        if not html_dir.exists():
-            pytest.skip("HTML documentation not generated")
-
-        index_file = html_dir / "index.html"
-        if not index_file.exists():
-            pytest.skip("index.html not found")
-
-        content = index_file.read_text()
-
         # Should have links to main sections
-        assert '<a href=' in content, "Should have navigation links"
+        assert '<a href=' in index_html_markers, "Should have navigation links"
 
         # Check for key sections
-        key_links = [
-            "DEVELOPER_GUIDE",
-            "BRIDGE_INTERFACE",
-            "api",
-        ]
-
-        for link in key_links:
-            assert link in content, f"Should link to {link}"
+        for link in _INDEX_KEY_LINKS:
+            assert link in index_html_markers, f"Should link to {link}"
 
 
 if __name__ == "__main__":
@@ -18,6 +18,7 @@ import time
 from pathlib import Path
 
 import pytest
+pytest.importorskip("playwright.async_api")
 from playwright.async_api import async_playwright, expect
 
 
@@ -11,6 +11,7 @@ import time
 from pathlib import Path
 
 import pytest
+pytest.importorskip("playwright.async_api")
 from playwright.async_api import async_playwright, expect
 
 from dashboard.server import DashboardServer
@@ -19,6 +19,12 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 from dashboard.server import DashboardServer
 
+# Headers a browser sends on a CORS preflight
+PREFLIGHT_HEADERS = {
+    "Origin": "http://example.com",
+    "Access-Control-Request-Method": "GET",
+}
+
 
 class TestOnboardingEndpoints(AioHTTPTestCase):
     """Test suite for onboarding API endpoints (AI-226)."""
@@ -229,14 +235,20 @@ class TestOnboardingEndpoints(AioHTTPTestCase):
         assert len(data["message"]) > 0
 
     async def test_onboarding_status_http_get_only(self):
-        """OPTIONS preflight for /api/onboarding/status returns 204."""
-        resp = await self.client.options("/api/onboarding/status")
+        """OPTIONS preflight for /api/onboarding/status returns 204 with CORS headers."""
+        resp = await self.client.options(
+            "/api/onboarding/status", headers=PREFLIGHT_HEADERS
+        )
         assert resp.status == 204
+        assert "Access-Control-Allow-Origin" in resp.headers
 
     async def test_onboarding_complete_http_options(self):
-        """OPTIONS preflight for /api/onboarding/complete returns 204."""
-        resp = await self.client.options("/api/onboarding/complete")
+        """OPTIONS preflight for /api/onboarding/complete returns 204 with CORS headers."""
+        resp = await self.client.options(
+            "/api/onboarding/complete", headers=PREFLIGHT_HEADERS
+        )
         assert resp.status == 204
+        assert "Access-Control-Allow-Origin" in resp.headers
 
     async def test_onboarding_status_linear_and_anthropic(self):
         """setup_complete is False when only Linear and Anthropic keys are set."""
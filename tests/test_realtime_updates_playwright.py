@@ -18,6 +18,7 @@ Success Criteria (from AI-127):
 import asyncio
 import pytest
 import time
+pytest.importorskip("playwright.async_api")
 from playwright.async_api import async_playwright, Page, expect
 from pathlib import Path
 
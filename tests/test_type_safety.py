@@ -20,6 +20,7 @@ import pytest
 REPO_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(REPO_ROOT))
 
+import protocols
 from protocols import (
     BridgeProtocol,
     ConfigProtocol,
@@ -401,35 +402,23 @@ class TestOptionalTypeHandling:
 class TestProtocolsModuleExports:
     """Tests that protocols.py correctly exports all protocol classes."""
 
-    def test_bridge_protocol_exported(self) -> None:
-        import protocols
-        assert hasattr(protocols, "BridgeProtocol")
-
-    def test_config_protocol_exported(self) -> None:
-        import protocols
-        assert hasattr(protocols, "ConfigProtocol")
-
-    def test_progress_tracker_protocol_exported(self) -> None:
-        import protocols
-        assert hasattr(protocols, "ProgressTrackerProtocol")
-
-    def test_exception_protocol_exported(self) -> None:
-        import protocols
-        assert hasattr(protocols, "ExceptionProtocol")
+    @pytest.mark.parametrize(
+        "name",
+        ["BridgeProtocol", "ConfigProtocol", "ProgressTrackerProtocol", "ExceptionProtocol"],
+    )
+    def test_protocol_exported(self, name: str) -> None:
+        assert hasattr(protocols, name)
 
     def test_bridge_protocol_is_runtime_checkable_class(self) -> None:
-        import protocols
         # runtime_checkable protocols have _is_protocol attribute
         assert getattr(protocols.BridgeProtocol, "_is_protocol", False) is True
 
     def test_config_protocol_is_runtime_checkable_class(self) -> None:
-        import protocols
         assert getattr(protocols.ConfigProtocol, "_is_protocol", False) is True
 
     def test_protocols_module_docstring(self) -> None:
-        import protocols
-        assert protocols.__doc__ is not None
-        assert len(protocols.__doc__) > 0
+        # None and "" both fail: the docstring must exist and be non-empty
+        assert protocols.__doc__
 
     def test_protocols_file_exists(self) -> None:
         protocols_path = REPO_ROOT / "protocols.py"
@@ -442,10 +431,10 @@ class TestProtocolsModuleExports:
             ProgressTrackerProtocol,
             ExceptionProtocol,
         )
-        assert BridgeProtocol is not None
-        assert ConfigProtocol is not None
-        assert ProgressTrackerProtocol is not None
-        assert ExceptionProtocol is not None
+        assert all(
+            p is not None
+            for p in (BridgeProtocol, ConfigProtocol, ProgressTrackerProtocol, ExceptionProtocol)
+        )
 
 
 # ---------------------------------------------------------------------------